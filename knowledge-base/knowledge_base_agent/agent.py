@@ -8,7 +8,6 @@ from pathlib import Path
 import asyncio
 from datetime import datetime
 import time
-import aiofiles
 
 from knowledge_base_agent.config import Config
 from knowledge_base_agent.exceptions import AgentError, MarkdownGenerationError
@@ -23,7 +22,7 @@ from knowledge_base_agent.prompts import UserPreferences
 from knowledge_base_agent.progress import ProcessingStats
 from knowledge_base_agent.content_processor import ContentProcessingError
 from knowledge_base_agent.tweet_utils import parse_tweet_id_from_url
-from knowledge_base_agent.file_utils import async_json_load
+from knowledge_base_agent.file_utils import async_json_load, async_write_text
 from knowledge_base_agent.http_client import HTTPClient
 from knowledge_base_agent.content_processor import ContentProcessor
 from knowledge_base_agent.tweet_cacher import TweetCacheValidator
@@ -172,8 +171,10 @@ class KnowledgeBaseAgent:
         """Cleanup temporary files and resources."""
         try:
             temp_files = list(self.config.data_processing_dir.glob("*.temp"))
-            for temp_file in temp_files:
-                temp_file.unlink()
+            await asyncio.gather(
+                *(asyncio.to_thread(temp_file.unlink) for temp_file in temp_files),
+                return_exceptions=True
+            )
             logging.info("Cleanup completed")
         except Exception as e:
             logging.warning(f"Cleanup failed: {e}")
@@ -293,8 +294,7 @@ class KnowledgeBaseAgent:
                     self.config.knowledge_base_dir,
                     self.category_manager
                 )
-                async with aiofiles.open(readme_path, 'w', encoding='utf-8') as f:
-                    await f.write(content)
+                await async_write_text(content, readme_path)
                 logging.info("Generated static README as fallback")
                 
         except Exception as e:
@@ -304,14 +304,10 @@ class KnowledgeBaseAgent:
     async def _verify_tweet_cached(self, tweet_id: str) -> bool:
         """Verify that a tweet exists in the cache."""
         try:
-            cache_file = Path(self.config.tweet_cache_file)
-            if not cache_file.exists():
-                logging.error("Tweet cache file does not exist")
-                return False
-            
-            cache_data = await async_json_load(cache_file)
-            return tweet_id in cache_data
-            
+            # The state manager holds the authoritative in-memory cache, so
+            # there's no need to re-read the cache JSON per verification
+            return bool(await self.state_manager.get_tweet(tweet_id))
+
         except Exception as e:
             logging.error(f"Error verifying tweet cache for {tweet_id}: {e}")
             return False
@@ -319,17 +315,11 @@ class KnowledgeBaseAgent:
     async def _verify_kb_item_created(self, tweet_id: str) -> bool:
         """Verify that a knowledge base item was created for the tweet."""
         try:
-            cache_file = Path(self.config.tweet_cache_file)
-            if not cache_file.exists():
-                logging.error("Tweet cache file does not exist")
-                return False
-            
-            cache_data = await async_json_load(cache_file)
-            if tweet_id not in cache_data:
+            tweet_data = await self.state_manager.get_tweet(tweet_id)
+            if not tweet_data:
                 logging.error(f"Tweet {tweet_id} not found in cache")
                 return False
-            
-            tweet_data = cache_data[tweet_id]
+
             if 'kb_item_path' in tweet_data:
                 kb_path = Path(tweet_data['kb_item_path'])
                 if kb_path.exists():
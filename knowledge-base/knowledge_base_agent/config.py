@@ -79,10 +79,16 @@ class Config(BaseSettings):
     process_kb_items: bool = Field(default=True, alias="PROCESS_KB_ITEMS")
     regenerate_readme: bool = Field(default=True, alias="REGENERATE_README")
     
+    # Response cache settings
+    response_cache_enabled: bool = Field(default=False, alias="RESPONSE_CACHE_ENABLED")
+    response_cache_path: Path = Field(default=Path("data/response_cache.db"), alias="RESPONSE_CACHE_PATH")
+
     # Request settings
     batch_size: int = Field(default=1, alias="BATCH_SIZE")
     max_retries: int = Field(default=5, alias="MAX_RETRIES")
     max_concurrent_requests: int = Field(default=1, alias="MAX_CONCURRENT_REQUESTS")
+    cache_concurrency: int = Field(default=16, alias="CACHE_CONCURRENCY")
+    download_chunk_size: int = Field(default=1 << 20, alias="DOWNLOAD_CHUNK_SIZE")
     request_timeout: int = Field(default=180, alias="REQUEST_TIMEOUT")
     retry_backoff: bool = Field(default=True, alias="RETRY_BACKOFF")
     
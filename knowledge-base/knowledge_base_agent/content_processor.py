@@ -1,24 +1,38 @@
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from knowledge_base_agent.config import Config
 from knowledge_base_agent.http_client import HTTPClient
 from knowledge_base_agent.state_manager import StateManager
 from knowledge_base_agent.category_manager import CategoryManager
 from knowledge_base_agent.exceptions import ContentProcessingError, KnowledgeBaseItemCreationError
 from knowledge_base_agent.tweet_cacher import cache_tweets
-from knowledge_base_agent.media_processor import process_media, has_unprocessed_non_video_media, count_media_items, VIDEO_MIME_TYPES
+from knowledge_base_agent.playwright_fetcher import close_playwright_fetcher
+from knowledge_base_agent.media_processor import process_media, has_unprocessed_non_video_media, count_media_items, build_combined_text, VIDEO_MIME_TYPES
 from knowledge_base_agent.text_processor import process_categories
 from knowledge_base_agent.kb_item_generator import create_knowledge_base_item
 from knowledge_base_agent.readme_generator import generate_root_readme, generate_static_root_readme
 from knowledge_base_agent.markdown_writer import MarkdownWriter
 from knowledge_base_agent.types import KnowledgeBaseItem
-import aiofiles
 import asyncio
+import hashlib
 import re
 from mimetypes import guess_type
-import shutil
+
+def _existing_media_files(tweet_data: Dict[str, Any]) -> List[Path]:
+    """Return downloaded media paths that exist on disk.
+
+    One Path construction and one stat per entry, instead of building the
+    Path twice at every call site.
+    """
+    files = []
+    for p in tweet_data.get('downloaded_media', []):
+        path = Path(p)
+        if path.exists():
+            files.append(path)
+    return files
 
 @dataclass
 class ProcessingStats:
@@ -36,8 +50,23 @@ class ContentProcessor:
         self.state_manager = state_manager
         self.stats = ProcessingStats()
         self.text_model = self.http_client.config.text_model
+        self._tweets_snapshot: Optional[Dict[str, Any]] = None
         logging.info(f"Initialized ContentProcessor with model: {self.text_model}")
 
+    async def _get_tweets_cached(self) -> Dict[str, Any]:
+        """Return the tweet snapshot, fetching from the state manager at most once.
+
+        Callers that mutate tweet state must invalidate via
+        _invalidate_tweets_snapshot() so the next read is fresh.
+        """
+        if self._tweets_snapshot is None:
+            self._tweets_snapshot = await self.state_manager.get_all_tweets()
+        return self._tweets_snapshot
+
+    def _invalidate_tweets_snapshot(self) -> None:
+        """Drop the memoized tweet snapshot after state changes."""
+        self._tweets_snapshot = None
+
     async def process_all_tweets(
         self,
         preferences,
@@ -50,7 +79,8 @@ class ContentProcessor:
         try:
             # Phase 1: Tweet Cache Initialization
             logging.info("=== Phase 1: Tweet Cache Initialization ===")
-            all_tweets = await self.state_manager.get_all_tweets()
+            self._invalidate_tweets_snapshot()
+            all_tweets = await self._get_tweets_cached()
             unprocessed = self.state_manager.unprocessed_tweets
             processed = list(self.state_manager.processed_tweets.keys())
             logging.info(f"Tweet Status:\n"
@@ -66,125 +96,189 @@ class ContentProcessor:
                 logging.info(f"Re-caching {len(uncached_tweets)} tweets with incomplete cache")
                 await cache_tweets(uncached_tweets, self.config, self.http_client, self.state_manager, force_recache=True)
                 await asyncio.sleep(1)
-                all_tweets = await self.state_manager.get_all_tweets()
+                self._invalidate_tweets_snapshot()
+                all_tweets = await self._get_tweets_cached()
                 for tweet_id in uncached_tweets:
                     tweet_data = all_tweets.get(tweet_id, {})
-                    media_files = [Path(p) for p in tweet_data.get('downloaded_media', []) if Path(p).exists()]
+                    media_files = _existing_media_files(tweet_data)
                     if tweet_data.get('media', []) and not media_files:
                         logging.warning(f"Tweet {tweet_id} re-caching failed; retrying")
                         await cache_tweets([tweet_id], self.config, self.http_client, self.state_manager, force_recache=True)
                         await asyncio.sleep(1)
-                        all_tweets = await self.state_manager.get_all_tweets()
+                        self._invalidate_tweets_snapshot()
+                        all_tweets = await self._get_tweets_cached()
                         logging.debug(f"Retried caching for tweet {tweet_id}")
 
-            # Phase 2: Media Processing
+            # Phases 2 and 3 are pipelined: each tweet flows into
+            # categorization as soon as its media is done, so vision and text
+            # requests overlap instead of the batch waiting on the slower phase
             logging.info("=== Phase 2: Media Processing ===")
             media_todo = sum(1 for tid in unprocessed if not all_tweets.get(tid, {}).get('media_processed', False))
             logging.info(f"Media Processing Needed: {media_todo} tweets")
-            for tweet_id in unprocessed:
-                tweet_data = all_tweets.get(tweet_id, {})
-                if not tweet_data.get('media_processed', False):
-                    logging.debug(f"Processing media for tweet {tweet_id}")
-                    try:
-                        updated_data = await process_media(tweet_data, self.http_client, self.config)
-                        await self.state_manager.update_tweet_data(tweet_id, updated_data)
-                        await self.state_manager.mark_media_processed(tweet_id)
-                        stats.media_processed += len(updated_data.get('downloaded_media', []))
-                        logging.debug(f"Completed media processing for tweet {tweet_id}")
-                    except Exception as e:
-                        logging.error(f"Failed to process media for tweet {tweet_id}: {e}")
-                        stats.error_count += 1
-
-            # Phase 3: Category Processing
             logging.info("=== Phase 3: Category Processing ===")
             cat_todo = sum(1 for tid in unprocessed if not all_tweets.get(tid, {}).get('categories_processed', False))
             logging.info(f"Category Processing Needed: {cat_todo} tweets")
-            for tweet_id in unprocessed:
-                tweet_data = all_tweets.get(tweet_id, {})
-                if not tweet_data.get('categories_processed', False) or self.config.reprocess_categories:
-                    logging.debug(f"Processing categories for tweet {tweet_id}")
-                    try:
-                        updated_data = await process_categories(tweet_id, tweet_data, self.config, self.http_client, self.state_manager)
-                        await self.state_manager.update_tweet_data(tweet_id, updated_data)
-                        await self.state_manager.mark_categories_processed(tweet_id)
-                        stats.categories_processed += 1
-                        logging.debug(f"Completed category processing for tweet {tweet_id}")
-                    except Exception as e:
-                        logging.error(f"Failed to process categories for tweet {tweet_id}: {e}")
-                        stats.error_count += 1
+            # One timestamp per pass is plenty for 'categorized_at'
+            phase_ts = datetime.now().isoformat()
+
+            async def _process_media_for_tweet(tweet_id: str, tweet_data: Dict[str, Any]) -> None:
+                # Per-tweet failures are swallowed here so one bad tweet
+                # doesn't cancel the rest of the phase
+                logging.debug(f"Processing media for tweet {tweet_id}")
+                try:
+                    updated_data = await process_media(tweet_data, self.http_client, self.config)
+                    await self.state_manager.update_tweet_data(tweet_id, updated_data)
+                    await self.state_manager.mark_media_processed(tweet_id)
+                    stats.media_processed += len(updated_data.get('downloaded_media', []))
+                    logging.debug(f"Completed media processing for tweet {tweet_id}")
+                except Exception as e:
+                    logging.error(f"Failed to process media for tweet {tweet_id}: {e}")
+                    stats.error_count += 1
+
+            async def _process_categories_for_tweet(tweet_id: str, tweet_data: Dict[str, Any]) -> None:
+                # Same containment as media: a failed tweet is counted,
+                # not allowed to cancel its siblings
+                logging.debug(f"Processing categories for tweet {tweet_id}")
+                try:
+                    updated_data = await process_categories(tweet_id, tweet_data, self.config, self.http_client, self.state_manager, timestamp=phase_ts)
+                    await self.state_manager.update_tweet_data(tweet_id, updated_data)
+                    await self.state_manager.mark_categories_processed(tweet_id)
+                    stats.categories_processed += 1
+                    logging.debug(f"Completed category processing for tweet {tweet_id}")
+                except Exception as e:
+                    logging.error(f"Failed to process categories for tweet {tweet_id}: {e}")
+                    stats.error_count += 1
+
+            # Bounded queue gives natural backpressure between the stages;
+            # the HTTP client's semaphore still caps total Ollama load
+            category_queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+            num_category_workers = max(self.config.max_concurrent_requests, 1)
+
+            async def _media_producer(tweet_id: str, tweet_data: Dict[str, Any]) -> None:
+                if not tweet_data.get('media_processed', False):
+                    await _process_media_for_tweet(tweet_id, tweet_data)
+                await category_queue.put((tweet_id, tweet_data))
+
+            async def _category_worker() -> None:
+                while True:
+                    item = await category_queue.get()
+                    if item is None:
+                        return
+                    tweet_id, tweet_data = item
+                    if not tweet_data.get('categories_processed', False) or self.config.reprocess_categories:
+                        await _process_categories_for_tweet(tweet_id, tweet_data)
+
+            self.state_manager.begin_batch()
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    workers = [tg.create_task(_category_worker()) for _ in range(num_category_workers)]
+                    async with asyncio.TaskGroup() as producers:
+                        for tweet_id in unprocessed:
+                            producers.create_task(_media_producer(tweet_id, all_tweets.get(tweet_id, {})))
+                    # Producers are drained; tell each worker to exit
+                    for _ in workers:
+                        await category_queue.put(None)
+            finally:
+                await self.state_manager.commit_batch()
 
             # Phase 4: Knowledge Base Creation
             logging.info("=== Phase 4: Knowledge Base Creation ===")
             kb_todo = sum(1 for tid in unprocessed if not all_tweets.get(tid, {}).get('kb_item_created', False))
             logging.info(f"KB Items Needed: {kb_todo} tweets")
             processed_in_phase = 0
-            for tweet_id in unprocessed:
-                tweet_data = all_tweets.get(tweet_id, {})
-                try:
-                    # Check if KB item needs creation or reprocessing
-                    if not tweet_data.get('kb_item_created', False) or self.config.reprocess_kb_items:
-                        logging.debug(f"Creating KB item for tweet {tweet_id}")
-                        media_files = [Path(p) for p in tweet_data.get('downloaded_media', []) if Path(p).exists()]
-                        if tweet_data.get('media', []):
-                            if not media_files:
-                                logging.warning(f"Tweet {tweet_id} has media but no files exist; re-caching")
-                                await cache_tweets([tweet_id], self.config, self.http_client, self.state_manager, force_recache=True)
-                                await asyncio.sleep(1)
-                                tweet_data = await self.state_manager.get_tweet(tweet_id)
-                                media_files = [Path(p) for p in tweet_data.get('downloaded_media', []) if Path(p).exists()]
-                                if not media_files:
-                                    logging.error(f"Tweet {tweet_id} still has no media files after re-caching: {tweet_data.get('downloaded_media', [])}")
-                                    stats.error_count += 1
-                                    continue
-                            if media_files and (not tweet_data.get('image_descriptions') or len(tweet_data.get('image_descriptions', [])) < len(media_files)):
-                                logging.debug(f"Tweet {tweet_id} re-processing media due to new files or missing descriptions")
-                                updated_data = await process_media(tweet_data, self.http_client, self.config)
-                                await self.state_manager.update_tweet_data(tweet_id, updated_data)
-                                await self.state_manager.mark_media_processed(tweet_id)
-                                stats.media_processed += len(updated_data.get('downloaded_media', []))
-                                tweet_data = updated_data
-                                media_files = [Path(p) for p in tweet_data.get('downloaded_media', []) if Path(p).exists()]
+            kb_incomplete = 0
+            kb_semaphore = asyncio.Semaphore(max(self.config.max_concurrent_requests, 1))
 
-                        kb_item = await self.create_knowledge_base_item(tweet_id, tweet_data)
-                        markdown_writer = MarkdownWriter(self.config)
-                        kb_path = await markdown_writer.write_kb_item(
-                            item=kb_item,
-                            media_files=media_files,
-                            media_descriptions=tweet_data.get('image_descriptions', []),
-                            root_dir=Path(self.config.knowledge_base_dir)
-                        )
-                        tweet_data['kb_item_created'] = True
-                        tweet_data['kb_item_path'] = str(kb_path)
-                        await self.state_manager.update_tweet_data(tweet_id, tweet_data)
-                        stats.processed_count += 1
-                        logging.debug(f"Created KB item for tweet {tweet_id} at {kb_path}")
-                        
-                        for media_file in media_files:
-                            if not media_file.exists():
-                                logging.error(f"Media file {media_file} missing before copy for tweet {tweet_id}")
-                                continue
-                            dest = kb_path / media_file.name
-                            if not dest.exists():
-                                shutil.copy2(media_file, dest)
-                                logging.debug(f"Copied media {media_file.name} to {dest}")
+            async def _create_kb_item_for_tweet(tweet_id: str, tweet_data: Dict[str, Any]):
+                """Create the KB item for one tweet. Returns (tweet_id, tweet_data, ok)."""
+                async with kb_semaphore:
+                    try:
+                        # Check if KB item needs creation or reprocessing
+                        if not tweet_data.get('kb_item_created', False) or self.config.reprocess_kb_items:
+                            combined_text = tweet_data.get('_combined_text') or build_combined_text(tweet_data)
+                            content_hash = hashlib.sha256(combined_text.encode('utf-8')).hexdigest()
+                            existing_path = tweet_data.get('kb_item_path')
+                            if (tweet_data.get('content_hash') == content_hash
+                                    and existing_path and Path(existing_path).exists()):
+                                # Source content unchanged since the last render; no
+                                # need to regenerate via the LLM or rewrite markdown
+                                logging.debug(f"Tweet {tweet_id} content unchanged, reusing KB item at {existing_path}")
+                                tweet_data['kb_item_created'] = True
+                            else:
+                                logging.debug(f"Creating KB item for tweet {tweet_id}")
+                                media_files = _existing_media_files(tweet_data)
+                                if tweet_data.get('media', []):
+                                    if not media_files:
+                                        logging.warning(f"Tweet {tweet_id} has media but no files exist; re-caching")
+                                        await cache_tweets([tweet_id], self.config, self.http_client, self.state_manager, force_recache=True)
+                                        await asyncio.sleep(1)
+                                        tweet_data = await self.state_manager.get_tweet(tweet_id)
+                                        media_files = _existing_media_files(tweet_data)
+                                        if not media_files:
+                                            logging.error(f"Tweet {tweet_id} still has no media files after re-caching: {tweet_data.get('downloaded_media', [])}")
+                                            stats.error_count += 1
+                                            return tweet_id, tweet_data, False
+                                    if media_files and (not tweet_data.get('image_descriptions') or len(tweet_data.get('image_descriptions', [])) < len(media_files)):
+                                        logging.debug(f"Tweet {tweet_id} re-processing media due to new files or missing descriptions")
+                                        updated_data = await process_media(tweet_data, self.http_client, self.config)
+                                        await self.state_manager.update_tweet_data(tweet_id, updated_data)
+                                        await self.state_manager.mark_media_processed(tweet_id)
+                                        stats.media_processed += len(updated_data.get('downloaded_media', []))
+                                        tweet_data = updated_data
+                                        media_files = _existing_media_files(tweet_data)
+
+                                kb_item = await self.create_knowledge_base_item(tweet_id, tweet_data)
+                                markdown_writer = MarkdownWriter(self.config)
+                                kb_path = await markdown_writer.write_kb_item(
+                                    item=kb_item,
+                                    media_files=media_files,
+                                    media_descriptions=tweet_data.get('image_descriptions', []),
+                                    root_dir=Path(self.config.knowledge_base_dir)
+                                )
+                                tweet_data['kb_item_created'] = True
+                                tweet_data['kb_item_path'] = str(kb_path)
+                                tweet_data['content_hash'] = content_hash
+                                await self.state_manager.update_tweet_data(tweet_id, tweet_data)
+                                stats.processed_count += 1
+                                logging.debug(f"Created KB item for tweet {tweet_id} at {kb_path}")
+
+                        return tweet_id, tweet_data, True
+                    except Exception as e:
+                        logging.error(f"Failed to process tweet {tweet_id}: {e}")
+                        stats.error_count += 1
+                        return tweet_id, tweet_data, False
 
+            # Fan out KB creation and mark tweets processed as each finishes
+            # rather than blocking the whole phase on each tweet in turn
+            self.state_manager.begin_batch()
+            try:
+                kb_tasks = [
+                    asyncio.ensure_future(_create_kb_item_for_tweet(tweet_id, all_tweets.get(tweet_id, {})))
+                    for tweet_id in list(unprocessed)
+                ]
+                for completed in asyncio.as_completed(kb_tasks):
+                    tweet_id, tweet_data, ok = await completed
+                    if not ok:
+                        continue
                     # Move fully processed tweets regardless of KB creation
-                    if (tweet_data.get('media_processed', True) and 
-                        tweet_data.get('categories_processed', True) and 
-                        tweet_data.get('kb_item_created', True) and 
-                        tweet_data.get('kb_item_path') and 
+                    if (tweet_data.get('media_processed', True) and
+                        tweet_data.get('categories_processed', True) and
+                        tweet_data.get('kb_item_created', True) and
+                        tweet_data.get('kb_item_path') and
                         Path(tweet_data['kb_item_path']).exists()):
                         await self.state_manager.mark_tweet_processed(tweet_id, tweet_data)
                         stats.processed_count += 1
                         processed_in_phase += 1
                         logging.debug(f"Tweet {tweet_id} fully processed and moved to processed tweets")
                     else:
-                        logging.warning(f"Tweet {tweet_id} not fully processed: media_processed={tweet_data.get('media_processed', False)}, "
-                                       f"categories_processed={tweet_data.get('categories_processed', False)}, "
-                                       f"kb_item_created={tweet_data.get('kb_item_created', False)}")
-                except Exception as e:
-                    logging.error(f"Failed to process tweet {tweet_id}: {e}")
-                    stats.error_count += 1
+                        kb_incomplete += 1
+                        logging.debug(f"Tweet {tweet_id} not fully processed: media_processed={tweet_data.get('media_processed', False)}, "
+                                      f"categories_processed={tweet_data.get('categories_processed', False)}, "
+                                      f"kb_item_created={tweet_data.get('kb_item_created', False)}")
+            finally:
+                await self.state_manager.commit_batch()
+            if kb_incomplete:
+                logging.warning("Knowledge base creation incomplete (%d tweets), proceeding anyway", kb_incomplete)
             logging.info(f"Processed {processed_in_phase} tweets in Phase 4")
 
             # Phase 5: README Generation
@@ -206,6 +300,9 @@ class ContentProcessor:
         except Exception as e:
             logging.error(f"Processing failed: {str(e)}")
             raise ContentProcessingError(f"Processing failed: {e}")
+        finally:
+            # Shut down the shared Playwright browser started for re-caching
+            await close_playwright_fetcher()
 
     async def _regenerate_readme(self) -> None:
         """Regenerate the root README file."""
@@ -223,13 +320,12 @@ class ContentProcessor:
                 self.config.knowledge_base_dir,
                 self.category_manager
             )
-            async with aiofiles.open(self.config.knowledge_base_dir / "README.md", 'w', encoding='utf-8') as f:
-                await f.write(content)
+            await async_write_text(content, self.config.knowledge_base_dir / "README.md")
             logging.info("Generated static README as fallback")
 
     async def get_tweets_with_media(self) -> Dict[str, Any]:
         """Get tweets that have unprocessed media."""
-        tweets = await self.state_manager.get_all_tweets()
+        tweets = await self._get_tweets_cached()
         media_tweets = {
             tweet_id: tweet_data 
             for tweet_id, tweet_data in tweets.items() 
@@ -240,7 +336,7 @@ class ContentProcessor:
 
     async def _count_media_items(self) -> int:
         """Count total media items across all tweets."""
-        tweets = await self.state_manager.get_all_tweets()
+        tweets = await self._get_tweets_cached()
         count = await count_media_items(tweets)
         logging.debug(f"Counted {count} media items across all tweets")
         return count
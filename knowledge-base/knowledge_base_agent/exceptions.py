@@ -1,114 +1,119 @@
-"""Custom exceptions for the knowledge base agent."""
+"""Custom exceptions for the knowledge base agent.
+
+All exceptions declare empty ``__slots__`` so instances skip the per-object
+``__dict__`` allocation — these can be raised at high rate in per-media and
+per-tweet error paths.
+"""
 
 class KnowledgeBaseError(Exception):
     """Base exception for knowledge base operations."""
-    pass
+    __slots__ = ()
 
 class AgentError(KnowledgeBaseError):
     """Raised when agent operations fail."""
-    pass
+    __slots__ = ()
 
 class BookmarksFetchError(KnowledgeBaseError):
     """Raised when bookmark fetching fails."""
-    pass
+    __slots__ = ()
 
 class MarkdownGenerationError(KnowledgeBaseError):
     """Markdown generation related errors."""
-    pass
+    __slots__ = ()
 
 class PathValidationError(KnowledgeBaseError):
     """Raised when path validation fails."""
-    pass
+    __slots__ = ()
 
 class StateError(KnowledgeBaseError):
     """State management related errors."""
-    pass
-
-class TweetProcessingError(KnowledgeBaseError):
-    """Legacy error class for backward compatibility."""
-    pass  # Now handled by ContentProcessingError
+    __slots__ = ()
 
 class ModelInferenceError(KnowledgeBaseError):
     """Raised when AI model inference fails."""
-    pass
+    __slots__ = ()
 
 class GitSyncError(KnowledgeBaseError):
     """Git synchronization related errors."""
-    pass
+    __slots__ = ()
 
 class ConfigurationError(KnowledgeBaseError):
     """Configuration related errors."""
-    pass
+    __slots__ = ()
 
 class FetchError(KnowledgeBaseError):
     """Raised when failing to fetch data from external sources."""
-    pass
+    __slots__ = ()
 
 class ProcessingError(KnowledgeBaseError):
     """Raised when failing to process content."""
-    pass
+    __slots__ = ()
 
 class StorageError(KnowledgeBaseError):
     """Raised when failing to store or retrieve data."""
-    pass
-
-class GitError(KnowledgeBaseError):
-    """Raised when Git operations fail."""
-    pass
+    __slots__ = ()
 
 class CategoryError(KnowledgeBaseError):
     """Category management related errors."""
-    pass
+    __slots__ = ()
 
 class AIError(KnowledgeBaseError):
     """Raised when AI operations (Ollama, etc.) fail."""
-    pass
+    __slots__ = ()
 
 class ValidationError(KnowledgeBaseError):
     """Raised when validation fails."""
-    pass
+    __slots__ = ()
 
 class FileOperationError(KnowledgeBaseError):
     """Raised when file operations fail."""
-    pass
+    __slots__ = ()
 
 class NetworkError(KnowledgeBaseError):
     """Network related errors."""
-    pass
+    __slots__ = ()
 
 class MediaProcessingError(KnowledgeBaseError):
     """Raised when media processing fails."""
-    pass
+    __slots__ = ()
 
 class ContentProcessingError(KnowledgeBaseError):
     """Content processing related errors."""
-    pass
+    __slots__ = ()
+
+# Legacy alias kept for backward compatibility
+TweetProcessingError = ContentProcessingError
+
+# Alias: git failures share one class
+GitError = GitSyncError
 
 class StateManagerError(KnowledgeBaseError):
     """State manager specific errors."""
-    pass
+    __slots__ = ()
 
 class VisionModelError(ModelInferenceError):
     """Error during vision model processing."""
-    pass
+    __slots__ = ()
 
 class ContentGenerationError(KnowledgeBaseError):
     """Raised when content generation fails."""
-    pass
+    __slots__ = ()
 
 class CategoryGenerationError(KnowledgeBaseError):
     """Raised when category generation fails."""
-    pass
+    __slots__ = ()
 
 class KnowledgeBaseItemCreationError(KnowledgeBaseError):
     """Raised when knowledge base item creation fails."""
-    pass
+    __slots__ = ()
 
 class CommandError(KnowledgeBaseError):
     """Raised when a command-line operation fails"""
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(f"Command failed: {message}")
 
 class PagesGenerationError(Exception):
     """Raised when GitHub Pages generation fails."""
-    pass
+    __slots__ = ()
@@ -1,16 +1,34 @@
 import aiofiles
+import asyncio
 import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON using orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data: Any, indent: bool = True) -> str:
+    """Serialize JSON using orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None)
+
 def safe_read_json(file_path: Path, default: Any = None) -> Any:
     """Unified JSON file reading with error handling."""
     if not file_path.exists():
         return default or {}
     try:
-        with file_path.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_loads(file_path.read_bytes())
     except Exception as e:
         logging.error(f"Failed to read JSON from {file_path}: {e}")
         return default or {}
@@ -19,8 +37,7 @@ def safe_write_json(file_path: Path, data: Any, indent: int = 4) -> bool:
     """Unified JSON file writing with error handling."""
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent)
+        file_path.write_text(json_dumps(data), encoding='utf-8')
         return True
     except Exception as e:
         logging.error(f"Failed to write JSON to {file_path}: {e}")
@@ -29,10 +46,10 @@ def safe_write_json(file_path: Path, data: Any, indent: int = 4) -> bool:
 async def async_json_load(filepath: Union[str, Path], default: Any = None) -> Any:
     """Load JSON data from a file asynchronously."""
     try:
-        async with aiofiles.open(filepath, 'r') as f:
+        async with aiofiles.open(filepath, 'rb') as f:
             content = await f.read()
-            return json.loads(content)
-    except (FileNotFoundError, json.JSONDecodeError):
+            return json_loads(content)
+    except (FileNotFoundError, ValueError):
         return default if default is not None else []
 
 async def async_json_dump(data: Any, filepath: Union[str, Path]) -> None:
@@ -40,7 +57,7 @@ async def async_json_dump(data: Any, filepath: Union[str, Path]) -> None:
     temp_path = Path(filepath).with_suffix('.tmp')
     try:
         async with aiofiles.open(temp_path, 'w') as f:
-            await f.write(json.dumps(data, indent=2))
+            await f.write(json_dumps(data))
         temp_path.rename(filepath)
     except Exception as e:
         logging.error(f"Atomic write failed: {e}")
@@ -53,9 +70,12 @@ async def async_read_text(file_path: Union[str, Path]) -> str:
         return await f.read()
 
 async def async_write_text(content: str, filepath: Union[str, Path]) -> None:
-    """Write text content to a file asynchronously."""
-    async with aiofiles.open(filepath, 'w') as f:
-        await f.write(content)
+    """Write text content to a file asynchronously.
+
+    One-shot writes go through a single to_thread hop; aiofiles would
+    dispatch open, write, and close to the executor separately.
+    """
+    await asyncio.to_thread(Path(filepath).write_text, content, encoding='utf-8')
 
 async def async_append_text(content: str, file_path: Union[str, Path]) -> None:
     """Asynchronously append to text file."""
@@ -28,11 +28,12 @@ class GitSyncHandler:
             
             # Ensure origin remote exists
             remote_url = str(self.config.github_repo_url).replace('https://', f'https://{self.config.github_token}@')
-            if 'origin' not in [r.name for r in self.repo.remotes]:
-                self.repo.create_remote('origin', remote_url)
+            existing = {r.name: r for r in self.repo.remotes}
+            if 'origin' not in existing:
+                existing['origin'] = self.repo.create_remote('origin', remote_url)
                 self.logger.debug(f"Created origin remote with URL: {remote_url}")
             else:
-                self.repo.remote('origin').set_url(remote_url)
+                existing['origin'].set_url(remote_url)
                 self.logger.debug(f"Updated origin remote URL to: {remote_url}")
             
             with self.repo.config_writer() as git_config:
@@ -52,16 +53,18 @@ class GitSyncHandler:
         try:
             await self._configure_git()
             repo = self.repo
-            
-            repo.git.add(A=True)
-            if repo.is_dirty(untracked_files=True):
-                repo.index.commit(commit_message)
+
+            # GitPython calls are synchronous and can take seconds; run them
+            # in a thread so the event loop keeps servicing other tasks
+            await asyncio.to_thread(repo.git.add, A=True)
+            if await asyncio.to_thread(repo.is_dirty, untracked_files=True):
+                await asyncio.to_thread(repo.index.commit, commit_message)
                 self.logger.debug(f"Committed changes with message: {commit_message}")
             else:
                 self.logger.info("No changes to commit")
-            
+
             # Force push to overwrite remote state
-            repo.git.push('origin', 'main', '--force')
+            await asyncio.to_thread(repo.git.push, 'origin', 'main', '--force')
             self.logger.debug("Force-pushed changes to remote repository")
             self.logger.info("Successfully synced to GitHub")
                 
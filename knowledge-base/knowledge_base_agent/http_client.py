@@ -1,10 +1,12 @@
+import json
 import logging
 import httpx
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, AsyncIterator, Dict, List
 import asyncio
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from knowledge_base_agent.config import Config
 from knowledge_base_agent.exceptions import NetworkError, AIError, ModelInferenceError
+from knowledge_base_agent.response_cache import ResponseCache
 import aiohttp
 import aiofiles
 from pathlib import Path
@@ -24,6 +26,7 @@ class HTTPClient:
         self.batch_size = self.config.batch_size
         self.max_concurrent = self.config.max_concurrent_requests
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self.response_cache = ResponseCache(config.response_cache_path) if config.response_cache_enabled else None
         logging.info(f"Initializing HTTPClient with Ollama URL: {self.base_url}")
         logging.info(f"Settings: timeout={self.timeout}s, max_retries={self.max_retries}, "
                     f"batch_size={self.batch_size}, max_concurrent={self.max_concurrent}")
@@ -31,7 +34,17 @@ class HTTPClient:
     async def initialize(self):
         """Initialize the HTTP client session."""
         if not self.initialized:
+            # Reuse connections across the many requests hitting the same
+            # Ollama host instead of paying connection setup per request
+            # Overall cap keeps the socket table bounded when fetches hit
+            # many distinct hosts (media CDNs) on top of the Ollama host
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                keepalive_timeout=60
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=aiohttp.ClientTimeout(total=self.timeout)
             )
             self.initialized = True
@@ -43,6 +56,8 @@ class HTTPClient:
             await self.session.close()
             self.initialized = False
             logging.info("HTTPClient session closed")
+        if self.response_cache:
+            self.response_cache.close()
             
     async def ensure_session(self):
         """Ensure a session exists."""
@@ -82,7 +97,13 @@ class HTTPClient:
             TimeoutError: If the request exceeds the timeout period
         """
         timeout = timeout or self.timeout
-        
+
+        if self.response_cache:
+            cached = self.response_cache.get(model, prompt, temperature, max_tokens, top_p)
+            if cached is not None:
+                logging.debug(f"Response cache hit for model {model}")
+                return cached
+
         # Use semaphore to limit concurrent requests
         async with self._semaphore:
             await self.ensure_session()
@@ -121,7 +142,10 @@ class HTTPClient:
                         raise AIError("Empty response from Ollama API")
                     
                     logging.debug(f"Received response of length: {len(response_text)} in {elapsed:.2f}s")
-                    
+
+                    if self.response_cache:
+                        self.response_cache.set(model, prompt, temperature, max_tokens, top_p, response_text)
+
                     # Add delay between requests based on batch size
                     if self.batch_size > 1:
                         await asyncio.sleep(1.0)  # Basic rate limiting
@@ -143,10 +167,90 @@ class HTTPClient:
                 logging.error(f"Unexpected error in ollama_generate: {str(e)}")
                 raise AIError(f"Failed to generate text with Ollama: {str(e)}")
             
+    async def ollama_generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 50000,
+        top_p: float = 0.9,
+        timeout: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text from the Ollama API as it is produced.
+
+        Uses Ollama's streaming mode (NDJSON lines) so callers can consume
+        tokens as they arrive instead of waiting for the full body.
+
+        Yields:
+            str: Incremental chunks of the generated response text
+
+        Raises:
+            AIError: If the API request fails or returns an error payload
+        """
+        timeout = timeout or self.timeout
+
+        # The cache stores full responses; a hit is replayed as one chunk so
+        # streaming callers get the same persistence ollama_generate has
+        if self.response_cache:
+            cached = self.response_cache.get(model, prompt, temperature, max_tokens, top_p)
+            if cached is not None:
+                logging.debug(f"Response cache hit for model {model} (streaming)")
+                yield cached
+                return
+
+        async with self._semaphore:
+            await self.ensure_session()
+
+            api_endpoint = f"{self.base_url}/api/generate"
+            try:
+                logging.debug(f"Sending streaming Ollama request to {api_endpoint} with model {model}")
+                async with self.session.post(
+                    api_endpoint,
+                    json={
+                        "model": model,
+                        "prompt": prompt,
+                        "stream": True,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                        "top_p": top_p
+                    },
+                    timeout=timeout
+                ) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        logging.error(f"Ollama API error: {response.status} - {error_text}")
+                        raise AIError(f"Ollama API returned status {response.status}")
+
+                    chunks = []
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        data = json.loads(line)
+                        if data.get("error"):
+                            raise AIError(f"Ollama API error: {data['error']}")
+                        chunk = data.get("response", "")
+                        if chunk:
+                            chunks.append(chunk)
+                            yield chunk
+                        if data.get("done"):
+                            break
+
+                    if self.response_cache and chunks:
+                        self.response_cache.set(model, prompt, temperature, max_tokens, top_p, ''.join(chunks))
+
+            except asyncio.TimeoutError:
+                logging.error(f"Streaming Ollama request timed out after {timeout} seconds")
+                raise AIError(f"Request timed out after {timeout} seconds")
+
+            except aiohttp.ClientError as e:
+                logging.error(f"HTTP client error during streaming generate: {str(e)}")
+                raise AIError(f"HTTP client error: {str(e)}")
+
     async def __aenter__(self):
         await self.initialize()
         return self
-        
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
@@ -199,7 +303,9 @@ class HTTPClient:
                 response.raise_for_status()
                 output_path.parent.mkdir(parents=True, exist_ok=True)
                 async with aiofiles.open(output_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
+                    # Large chunks (1 MiB default) keep memory bounded per
+                    # download while avoiding the syscall churn of tiny writes
+                    async for chunk in response.content.iter_chunked(self.config.download_chunk_size):
                         await f.write(chunk)
         except Exception as e:
             logging.error(f"Failed to download media from {url}: {str(e)}")
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import logging
 from pathlib import Path
@@ -5,13 +6,16 @@ from typing import Optional
 from knowledge_base_agent.exceptions import VisionModelError
 from knowledge_base_agent.http_client import HTTPClient
 
+def _encode_image(image_path: Path) -> str:
+    """Read an image and base64-encode it for the Ollama images field."""
+    return base64.b64encode(image_path.read_bytes()).decode('utf-8')
+
 async def interpret_image(http_client: HTTPClient, image_path: Path, vision_model: str) -> str:
     """Interpret image content using vision model."""
     try:
-        # Read and encode image
-        with open(image_path, 'rb') as f:
-            image_bytes = f.read()
-            image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+        # Reading + encoding a multi-MB image is blocking work; keep it off
+        # the event loop so concurrent interpretations overlap
+        image_base64 = await asyncio.to_thread(_encode_image, image_path)
 
         # Prepare prompt for vision model
         prompt = "Describe this image in detail, focusing on the main subject and any relevant technical details."
@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 from datetime import datetime
-from knowledge_base_agent.exceptions import StorageError, ContentProcessingError, ContentGenerationError, KnowledgeBaseItemCreationError
+from knowledge_base_agent.exceptions import StorageError, ContentProcessingError, ContentGenerationError, KnowledgeBaseItemCreationError, AIError
 from knowledge_base_agent.config import Config
 from knowledge_base_agent.http_client import HTTPClient
 from knowledge_base_agent.state_manager import StateManager
@@ -100,15 +100,28 @@ async def create_knowledge_base_item(tweet_id: str, tweet_data: Dict[str, Any],
             "\nFormat the response in markdown with appropriate sections."
         )
         
-        # Generate content using LLM
-        generated_content = await http_client.ollama_generate(
-            model=config.text_model,
-            prompt=prompt
-        )
-        
+        # Generate content using LLM, streaming chunks as they are produced
+        # instead of buffering the full response body in one request. The
+        # streaming path has no tenacity retry, so a transient failure falls
+        # back to the retried non-streaming call instead of failing the tweet.
+        try:
+            chunks = []
+            async for chunk in http_client.ollama_generate_stream(
+                model=config.text_model,
+                prompt=prompt
+            ):
+                chunks.append(chunk)
+            generated_content = ''.join(chunks)
+        except AIError as e:
+            logging.warning(f"Streaming generation failed for tweet {tweet_id}, retrying non-streaming: {e}")
+            generated_content = await http_client.ollama_generate(
+                model=config.text_model,
+                prompt=prompt
+            )
+
         if not generated_content:
             raise ContentGenerationError("Generated content is empty")
-        
+
         # Parse generated content to extract title and description
         content_parts = generated_content.split('\n', 2)
         title = content_parts[0].lstrip('#').strip() if content_parts else context['item_name']
@@ -158,26 +171,24 @@ async def create_knowledge_base_entry(
 ) -> None:
     """Create a knowledge base entry for a tweet."""
     from .text_processor import categorize_and_name_content
-    from .media_processor import process_media_content
+    from .media_processor import process_media_content, build_combined_text
     from .markdown_writer import MarkdownWriter
     
     original_state = copy.deepcopy(tweet_data)
     try:
-        logging.info(f"Starting knowledge base entry creation for tweet {tweet_id}")
-        
+        logging.debug("Starting knowledge base entry creation for tweet %s", tweet_id)
+
         # Process media content first
-        logging.info(f"Processing media content for tweet {tweet_id}")
         try:
             tweet_data = await process_media_content(tweet_data, http_client, config)
-            logging.info(f"Successfully processed media for tweet {tweet_id}")
+            logging.debug("Successfully processed media for tweet %s", tweet_id)
         except Exception as e:
             logging.error(f"Failed to process media content for tweet {tweet_id}: {str(e)}")
             raise
 
-        # Combine tweet text and image descriptions
+        # Combine tweet text and image descriptions, reusing the cached copy when present
         content_text = tweet_data.get('full_text', '')
-        image_descriptions = tweet_data.get('image_descriptions', [])
-        combined_text = f"{content_text}\n\n" + "\n".join(image_descriptions) if image_descriptions else content_text
+        combined_text = tweet_data.get('_combined_text') or build_combined_text(tweet_data)
 
         if not combined_text:
             raise ContentProcessingError(f"No content found for tweet {tweet_id}")
@@ -211,7 +222,7 @@ async def create_knowledge_base_entry(
             if state_manager:
                 await state_manager.update_tweet_data(tweet_id, tweet_data)
         else:
-            logging.info(f"Using cached categories for tweet {tweet_id}: {categories}")
+            logging.debug("Using cached categories for tweet %s: %s", tweet_id, categories)
             main_cat = categories['main_category']
             sub_cat = categories['sub_category']
             item_name = categories['item_name']
@@ -232,11 +243,12 @@ async def create_knowledge_base_entry(
         
         image_descriptions = tweet_data.get('image_descriptions', [])
         
-        logging.info(f"Preparing to write markdown for tweet {tweet_id}")
-        logging.info(f"Categories: {main_cat}/{sub_cat}/{item_name}")
-        logging.info(f"Content length: {len(content_text)}")
-        logging.info(f"Number of images: {len(image_files)}")
-        logging.info(f"Tweet data keys: {list(tweet_data.keys())}")
+        # Lazy %-style formatting so these per-tweet records cost nothing
+        # when the logger is disabled at DEBUG
+        logging.debug("Preparing to write markdown for tweet %s: categories=%s/%s/%s, content length=%d, images=%d",
+                      tweet_id, main_cat, sub_cat, item_name, len(content_text), len(image_files))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Tweet data keys: %s", list(tweet_data.keys()))
         
         if not content_text:
             raise ContentProcessingError(f"No text content found for tweet {tweet_id}")
@@ -256,12 +268,12 @@ async def create_knowledge_base_entry(
                 tweet_text=content_text,
                 tweet_url=tweet_url
             )
-            logging.info(f"Successfully wrote markdown for tweet {tweet_id}")
+            logging.debug("Successfully wrote markdown for tweet %s", tweet_id)
         except Exception as e:
             logging.error(f"Failed to write markdown for tweet {tweet_id}: {str(e)}")
             raise
-        
-        logging.info(f"Successfully created knowledge base entry for tweet {tweet_id}")
+
+        logging.info("Successfully created knowledge base entry for tweet %s", tweet_id)
         
         # Only update state AFTER successful completion
         if state_manager:
@@ -7,6 +7,7 @@ with proper error handling and logging.
 
 import asyncio
 import logging
+import sys
 from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -84,10 +85,13 @@ async def cleanup(config: Config) -> None:
     """Cleanup temporary files and resources."""
     try:
         temp_files = list(config.data_processing_dir.glob("*.temp"))
-        for temp_file in temp_files:
-            temp_file.unlink()
-            logging.debug(f"Removed temporary file: {temp_file}")
-        logging.info("Cleanup completed")
+        results = await asyncio.gather(
+            *(asyncio.to_thread(temp_file.unlink) for temp_file in temp_files),
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        logging.info(f"Cleanup completed: removed {len(temp_files) - len(errors)} temporary files"
+                     + (f", {len(errors)} failed" if errors else ""))
     except Exception as e:
         logging.warning(f"Cleanup failed: {e}")
 
@@ -98,7 +102,7 @@ async def main() -> None:
         
         logging.info("\n=== New Agent Run Started ===")
         
-        preferences = prompt_for_preferences(config)
+        preferences = await prompt_for_preferences(config)
         
         logging.info("=== User Selected Preferences ===")
         logging.info(f"- Fetch new bookmarks: {preferences.update_bookmarks}")
@@ -123,4 +127,11 @@ async def main() -> None:
         await cleanup(config)
 
 if __name__ == "__main__":
+    # uvloop gives the network-heavy agent a faster event loop where available
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(main())
\ No newline at end of file
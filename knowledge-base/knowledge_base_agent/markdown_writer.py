@@ -1,4 +1,8 @@
 from datetime import datetime
+import functools
+import hashlib
+import json
+import os
 import re
 import shutil
 import uuid
@@ -6,20 +10,33 @@ import logging
 from pathlib import Path
 from .naming_utils import safe_directory_name
 import asyncio
-import aiofiles
-from typing import Dict, List, Optional, Any, AsyncGenerator
+import aiofiles.os
+from typing import Dict, List, Optional, Any, Tuple
 
 from knowledge_base_agent.exceptions import MarkdownGenerationError
 from knowledge_base_agent.config import Config
 from knowledge_base_agent.path_utils import PathNormalizer, DirectoryManager, create_kb_path
 from knowledge_base_agent.types import KnowledgeBaseItem
 
-_folder_creation_lock = asyncio.Lock()
+# Compiled once; format_links_in_text runs for every tweet rendered
+_URL_PATTERN = re.compile(r'(https?://\S+)')
+
+@functools.lru_cache(maxsize=1024)
+def _format_datetime(dt: datetime) -> str:
+    """Format a datetime for markdown output, caching repeated timestamps."""
+    return dt.strftime('%Y-%m-%d %H:%M:%S')
+
+def _write_small_file(path: Path, content: str) -> None:
+    """Write a small file in one shot.
+
+    KB markdown files are a few KB at most; a single open/write/close in one
+    worker thread beats aiofiles' separate thread hop per operation.
+    """
+    path.write_bytes(content.encode('utf-8'))
 
 def format_links_in_text(text: str) -> str:
     """Format URLs in text as markdown links."""
-    url_pattern = re.compile(r'(https?://\S+)')
-    return url_pattern.sub(r'[\1](\1)', text)
+    return _URL_PATTERN.sub(r'[\1](\1)', text)
 
 def generate_tweet_markdown_content(
     item_name: str,
@@ -30,24 +47,25 @@ def generate_tweet_markdown_content(
 ) -> str:
     """Generate markdown content for a tweet with correct image references."""
     formatted_tweet_text = format_links_in_text(tweet_text)
-    lines = [
-        f"# {item_name}",
-        "",
-        f"**Tweet URL:** [{tweet_url}]({tweet_url})",
-        "",
-        f"**Tweet Text:** {formatted_tweet_text}",
-        ""
-    ]
 
     # Use provided filenames or default to image_{i+1}.jpg
     if not image_filenames:
         image_filenames = [f"image_{i+1}.jpg" for i in range(len(image_descriptions))]
 
-    for i, (desc, filename) in enumerate(zip(image_descriptions, image_filenames)):
-        lines.append(f"**Image {i+1} Description:** {desc}")
-        lines.append(f"![Image {i+1}](./{filename})")
-        lines.append("")
-    return "\n".join(lines)
+    # Rendered as one fused template; only the image block varies in length
+    image_section = "".join(
+        f"\n**Image {i+1} Description:** {desc}\n"
+        f"![Image {i+1}](./{filename})\n"
+        for i, (desc, filename) in enumerate(zip(image_descriptions, image_filenames))
+    )
+    return (
+        f"# {item_name}\n"
+        "\n"
+        f"**Tweet URL:** [{tweet_url}]({tweet_url})\n"
+        "\n"
+        f"**Tweet Text:** {formatted_tweet_text}\n"
+        f"{image_section}"
+    )
 
 class MarkdownWriter:
     """Handles writing content to markdown files in the knowledge base."""
@@ -57,31 +75,54 @@ class MarkdownWriter:
         self.path_normalizer = PathNormalizer()
         self.dir_manager = DirectoryManager()
         self.valid_image_extensions = ('.jpg', '.jpeg', '.png', '.webp')  # Could move to Config
+        # Rendered markdown keyed by a hash of the render inputs; repeated
+        # renders of unchanged items reuse the prior output
+        self._render_cache: Dict[str, str] = {}
 
-    async def _validate_and_copy_media(self, media_files: List[Path], target_dir: Path) -> AsyncGenerator[tuple, None]:
-        """Validate and copy media files, yielding valid files copied and their new names."""
+    async def _validate_and_copy_media(self, media_files: List[Path], target_dir: Path) -> List[Tuple[Path, str]]:
+        """Validate and copy media files, returning (source path, new name) pairs."""
         valid_files = [img for img in media_files if img.suffix.lower() in self.valid_image_extensions]
         if len(valid_files) != len(media_files):
             invalid_files = [img.name for img in media_files if img not in valid_files]
             logging.warning(f"Invalid media types skipped: {invalid_files}")
 
-        for i, img_path in enumerate(valid_files):
-            if img_path.exists():
-                # Extract the original index from the filename if it follows media_X pattern
-                original_idx = None
-                if img_path.stem.startswith('media_'):
-                    try:
-                        original_idx = int(img_path.stem.split('_')[1])
-                    except (IndexError, ValueError):
-                        pass
-                
-                # Use consistent naming: image_{i+1}{suffix}
-                img_name = f"image_{i+1}{img_path.suffix.lower()}"
-                new_path = target_dir / img_name
-                await self.dir_manager.copy_file(img_path, new_path)
-                
-                # Yield both the original path and the new name for tracking
-                yield (img_path, img_name)
+        # Use consistent naming: image_{i+1}{suffix}
+        pairs = [
+            (img_path, f"image_{i+1}{img_path.suffix.lower()}")
+            for i, img_path in enumerate(valid_files)
+            if img_path.exists()
+        ]
+        # Moves target distinct files, so issue them concurrently; a move is
+        # a rename on the same filesystem, replacing the old copy-then-unlink
+        # dance that rewrote every image byte
+        results = await asyncio.gather(
+            *(self.dir_manager.move_file(img_path, target_dir / img_name)
+              for img_path, img_name in pairs),
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            # Siblings that did move must go back before we propagate, or
+            # the caller's temp-dir cleanup would delete the only copies
+            await self._restore_staged_media(pairs, target_dir)
+            raise failures[0]
+        return pairs
+
+    async def _restore_staged_media(self, staged: List[Tuple[Path, str]], staging_dir: Path) -> None:
+        """Move staged media back to their cache locations after a failure.
+
+        Media is moved (not copied) into the staging directory, so any error
+        path that removes that directory must first return the files — the
+        cache copy is the only local one, and the source tweet may be gone.
+        """
+        for source, name in staged:
+            staged_path = staging_dir / name
+            if not staged_path.exists() or source.exists():
+                continue
+            try:
+                await self.dir_manager.move_file(staged_path, source)
+            except Exception as e:
+                logging.error(f"Failed to restore media {staged_path} to {source}: {e}")
 
     async def write_tweet_markdown(
         self,
@@ -109,26 +150,28 @@ class MarkdownWriter:
         safe_item_name = safe_directory_name(item_name)
         tweet_folder = root_dir / main_category / sub_category / safe_item_name
 
-        async with _folder_creation_lock:
-            if tweet_folder.exists():
-                unique_suffix = uuid.uuid4().hex[:6]
-                safe_item_name = f"{safe_item_name}_{unique_suffix}"
-                tweet_folder = root_dir / main_category / sub_category / safe_item_name
-
-        temp_folder = tweet_folder.with_suffix('.temp')
-        temp_folder.mkdir(parents=True, exist_ok=True)
+        # Claim the folder optimistically: an exclusive mkdir on the temp
+        # directory replaces the old global creation lock, and a fresh uuid
+        # suffix resolves collisions without serializing unrelated tweets
+        while True:
+            temp_folder = tweet_folder.with_suffix('.temp')
+            if not tweet_folder.exists():
+                try:
+                    temp_folder.mkdir(parents=True, exist_ok=False)
+                    break
+                except FileExistsError:
+                    pass
+            unique_suffix = uuid.uuid4().hex[:6]
+            tweet_folder = root_dir / main_category / sub_category / f"{safe_item_name}_{unique_suffix}"
 
+        copied: List[Tuple[Path, str]] = []
         try:
             if not tweet_text.strip():
                 logging.warning(f"Empty tweet text for tweet {tweet_id}")
 
-            # Copy valid media files and track new filenames
-            cleanup_files = []
-            image_filenames = []
-            
-            async for img_path, new_filename in self._validate_and_copy_media(image_files, temp_folder):
-                cleanup_files.append(img_path)
-                image_filenames.append(new_filename)
+            # Move valid media files in and track new filenames
+            copied = await self._validate_and_copy_media(image_files, temp_folder)
+            image_filenames = [img_name for _, img_name in copied]
 
             # Generate content with correct filenames
             content_md = generate_tweet_markdown_content(
@@ -140,20 +183,16 @@ class MarkdownWriter:
             )
             
             content_md_path = temp_folder / "README.md"  # Use README.md instead of content.md
-            async with aiofiles.open(content_md_path, 'w', encoding="utf-8") as f:
-                await f.write(content_md)
-
-            # Cleanup original files
-            for img_path in image_files:
-                if img_path.exists() and img_path in cleanup_files:
-                    img_path.unlink()
+            await asyncio.to_thread(_write_small_file, content_md_path, content_md)
 
             return str(tweet_folder / "README.md")
 
         except Exception as e:
             logging.error(f"Failed to write tweet markdown for {tweet_id}: {str(e)}")
+            # Return moved media to the cache before discarding the staging dir
+            await self._restore_staged_media(copied, temp_folder)
             if temp_folder.exists():
-                shutil.rmtree(temp_folder)
+                await asyncio.to_thread(shutil.rmtree, temp_folder)
             raise MarkdownGenerationError(f"Failed to write tweet markdown: {str(e)}")
 
     async def write_kb_item(
@@ -174,37 +213,44 @@ class MarkdownWriter:
                 kb_path = root_dir / kb_path
 
             temp_dir = kb_path.with_suffix('.temp')
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.makedirs(temp_dir, exist_ok=True)
 
+            staged: List[Tuple[Path, str]] = []
             try:
                 # Ensure tweet URL is included
                 content = f"{item.content}\n\n---\n**Source**: [Original Tweet]({item.source_tweet['url']})"
-                
+
                 readme_path = temp_dir / "README.md"
-                async with aiofiles.open(readme_path, 'w', encoding='utf-8') as f:
-                    await f.write(content)
+                await asyncio.to_thread(_write_small_file, readme_path, content)
 
-                cleanup_files = []
                 if media_files:
-                    async for img_path, img_name in self._validate_and_copy_media(media_files, temp_dir):
-                        cleanup_files.append(img_path)
+                    staged = await self._validate_and_copy_media(media_files, temp_dir)
 
+                # Directory removal and rename are blocking syscalls; keep
+                # them off the event loop under concurrent KB creation
                 if kb_path.exists():
-                    shutil.rmtree(kb_path)
-                temp_dir.rename(kb_path)
+                    await asyncio.to_thread(shutil.rmtree, kb_path)
 
-                # Cleanup original files
-                if media_files:
-                    for img_path in media_files:
-                        if img_path.exists() and img_path in cleanup_files:
-                            img_path.unlink()
+                def _publish() -> None:
+                    os.replace(temp_dir, kb_path)
+                    # fsync the parent so the publishing rename survives a
+                    # crash, not just the files inside the directory
+                    dir_fd = os.open(kb_path.parent, os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+
+                await asyncio.to_thread(_publish)
 
                 return kb_path
 
             except Exception as e:
                 logging.error(f"Failed to write KB item content: {str(e)}")
+                # Return moved media to the cache before discarding the staging dir
+                await self._restore_staged_media(staged, temp_dir)
                 if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
+                    await asyncio.to_thread(shutil.rmtree, temp_dir)
                 raise
 
         except Exception as e:
@@ -218,25 +264,39 @@ class MarkdownWriter:
         media_descriptions: List[str] = None
     ) -> str:
         """Generate markdown content with proper formatting."""
-        content = item.content
-        source_section = [
-            "\n## Source\n",
-            f"- Original Tweet: [{item.source_tweet['url']}]({item.source_tweet['url']})",
-            f"- Date: {item.source_tweet['created_at'].strftime('%Y-%m-%d %H:%M:%S')}\n"
-        ]
-        
-        media_section = []
+        cache_key = hashlib.blake2b(json.dumps({
+            'content': item.content,
+            'url': item.source_tweet['url'],
+            'created_at': item.source_tweet['created_at'].isoformat(),
+            'media': [media.name for media in (media_files or [])],
+            'descriptions': media_descriptions or [],
+        }, sort_keys=True).encode()).hexdigest()
+        cached = self._render_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # One fused template; the media block is the only variable-length
+        # piece, so it is joined on its own and interpolated once
+        media_section = ""
         if media_files and media_descriptions:
-            media_section.append("\n## Media\n")
-            for idx, (media, desc) in enumerate(zip(media_files, media_descriptions), 1):
-                media_section.extend([
-                    f"### Media {idx}",
-                    f"![{media.stem}](./{media.name})",
-                    f"**Description:** {desc}\n"
-                ])
-        
-        timestamp = f"\n*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
-        return content + '\n'.join(source_section + media_section) + timestamp
+            media_section = "\n## Media\n\n" + "".join(
+                f"### Media {idx}\n"
+                f"![{media.stem}](./{media.name})\n"
+                f"**Description:** {desc}\n\n"
+                for idx, (media, desc) in enumerate(zip(media_files, media_descriptions), 1)
+            )
+
+        tweet_url = item.source_tweet['url']
+        rendered = (
+            f"{item.content}"
+            "\n## Source\n\n"
+            f"- Original Tweet: [{tweet_url}]({tweet_url})\n"
+            f"- Date: {_format_datetime(item.source_tweet['created_at'])}\n"
+            f"{media_section}"
+            f"\n*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+        )
+        self._render_cache[cache_key] = rendered
+        return rendered
 
 def validate_media_references(content: str, directory: Path) -> bool:
     """Validate that all media references in the content exist in the directory."""
@@ -9,6 +9,14 @@ from mimetypes import guess_type
 
 VIDEO_MIME_TYPES = {'video/mp4', 'video/quicktime', 'video/x-msvideo', 'video/x-matroska'}
 
+def build_combined_text(tweet_data: Dict[str, Any]) -> str:
+    """Combine tweet text and image descriptions into a single string for LLM prompts."""
+    tweet_text = tweet_data.get('full_text', '')
+    image_descriptions = tweet_data.get('image_descriptions', [])
+    if not image_descriptions:
+        return tweet_text
+    return f"{tweet_text}\n\nImage Descriptions:\n" + "\n".join(image_descriptions)
+
 async def process_media(tweet_data: Dict[str, Any], http_client: HTTPClient, config: Config) -> Dict[str, Any]:
     """Process non-video media content for a tweet, skipping videos."""
     try:
@@ -53,6 +61,8 @@ async def process_media(tweet_data: Dict[str, Any], http_client: HTTPClient, con
 
         tweet_data['image_descriptions'] = image_descriptions
         tweet_data['media_processed'] = not has_unprocessed_images
+        # Cache the combined text so downstream phases don't rebuild it per call
+        tweet_data['_combined_text'] = build_combined_text(tweet_data)
         return tweet_data
 
     except Exception as e:
@@ -105,6 +115,8 @@ async def process_media_content(tweet_data: Dict[str, Any], http_client: HTTPCli
         tweet_data['image_descriptions'] = image_descriptions
         # Mark as processed if no unprocessed images remain
         tweet_data['media_processed'] = not has_unprocessed_images
+        # Cache the combined text so downstream phases don't rebuild it per call
+        tweet_data['_combined_text'] = build_combined_text(tweet_data)
         return tweet_data
 
     except Exception as e:
@@ -1,10 +1,20 @@
 import re
 import uuid
 import logging
+import functools
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from pathlib import Path
 
+# Shared session so repeated rename calls reuse keep-alive connections
+# instead of a TCP+TLS handshake per request; pool sized for the level of
+# concurrency the processing phases fan out to
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=3)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
 def validate_directory_name(name: str, max_length: int = 50) -> bool:
     if len(name) > max_length:
         return False
@@ -12,10 +22,11 @@ def validate_directory_name(name: str, max_length: int = 50) -> bool:
         return False
     return True
 
-def normalize_name_for_filesystem(name: str, max_length: int = 30) -> str:
+@functools.lru_cache(maxsize=1024)
+def _normalize(name: str, max_length: int) -> str:
     # First remove any .md extension and apostrophes
     name = name.replace('.md', '').replace("'", "")
-    
+
     # Then process as before
     name = ' '.join(name.split())
     name = name.lower().replace(' ', '_')
@@ -23,10 +34,16 @@ def normalize_name_for_filesystem(name: str, max_length: int = 30) -> str:
     name = re.sub(r"[-_]+", '_', name)
     if len(name) > max_length:
         name = name[:max_length].rsplit('_', 1)[0]
-    name = name.strip('_-')
-    if not name:
+    return name.strip('_-')
+
+def normalize_name_for_filesystem(name: str, max_length: int = 30) -> str:
+    # Category and item names repeat heavily across README regeneration and
+    # KB-item writes, so the deterministic normalization is memoized; the
+    # random fallback for empty results stays outside the cache.
+    normalized = _normalize(name, max_length)
+    if not normalized:
         return f"unnamed_{uuid.uuid4().hex[:8]}"
-    return name
+    return normalized
 
 def safe_directory_name(name: str, existing_path: Optional[Path] = None) -> str:
     safe_name = normalize_name_for_filesystem(name)
@@ -85,12 +102,12 @@ def fix_invalid_name(
         ollama_url: The base URL for the AI API.
         max_retries: Number of attempts to fix the name.
         timeout: Read timeout for the HTTP call (in seconds).
-        http_client: An optional injected HTTP client (defaults to requests if None).
-    
+        http_client: An optional injected HTTP client (defaults to the module's pooled session).
+
     Returns:
         A valid item name as a string.
     """
-    client = http_client or requests
+    client = http_client or _session
     fix_prompt = (
         f"You previously suggested the item name: '{current_name}'. That is invalid.\n"
         f"Category: {main_cat}, SubCategory: {sub_cat}\n\n"
@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Dict, Any, List
+import asyncio
 import logging
 import aiofiles
 import yaml
@@ -506,7 +507,8 @@ async def copy_media_files(source_dir: Path, target_dir: Path) -> None:
     
     for file in source_dir.glob('*'):
         if file.is_file() and (file.name.startswith('image_') or file.suffix.lower() in ('.jpg', '.jpeg', '.png', '.gif', '.webp')):
-            shutil.copy2(file, target_dir / file.name)
+            # Copies block for the full disk latency; keep them off the loop
+            await asyncio.to_thread(shutil.copy2, file, target_dir / file.name)
             logging.debug(f"Copied media file: {file} -> {target_dir / file.name}")
 
 async def get_item_description(readme_path: Path) -> str:
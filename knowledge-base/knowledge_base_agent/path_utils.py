@@ -1,3 +1,4 @@
+import errno
 import re
 import unicodedata
 from pathlib import Path
@@ -76,13 +77,24 @@ class PathNormalizer:
             
         return path
 
+# Directories confirmed to exist this run; category/subcategory parents
+# repeat across tweets, so each one costs a stat+mkdir only once
+_known_dirs: set = set()
+
+def ensure_dir_cached(path: Path) -> None:
+    """mkdir -p that remembers which directories already exist."""
+    if path in _known_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _known_dirs.add(path)
+
 class DirectoryManager:
     @staticmethod
     async def ensure_directory(path: Union[str, Path]) -> Path:
         """Ensure directory exists and is valid."""
         path = Path(path)
         try:
-            path.mkdir(parents=True, exist_ok=True)
+            ensure_dir_cached(path)
             return path
         except Exception as e:
             raise PathValidationError(f"Failed to create directory: {path}") from e
@@ -113,8 +125,8 @@ class DirectoryManager:
         """
         try:
             # Ensure destination directory exists
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            
+            ensure_dir_cached(destination.parent)
+
             # Use asyncio to run shutil.copy2 in a thread pool
             await asyncio.get_event_loop().run_in_executor(
                 None, shutil.copy2, str(source), str(destination)
@@ -126,6 +138,42 @@ class DirectoryManager:
             logging.error(f"Failed to copy file from {source} to {destination}: {e}")
             raise
 
+    async def move_file(self, source: Path, destination: Path) -> None:
+        """
+        Asynchronously move a file from source to destination.
+
+        Uses os.replace so same-filesystem moves are a metadata-only rename
+        rather than a byte copy; falls back to copy+unlink across filesystems.
+
+        Args:
+            source (Path): Source file path
+            destination (Path): Destination file path
+        """
+        def _move() -> None:
+            try:
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Cheap second attempt before rewriting every byte: a hard
+                # link succeeds on setups where rename is refused but the
+                # paths still share a filesystem (e.g. some bind mounts)
+                try:
+                    os.link(source, destination)
+                    os.unlink(source)
+                except OSError:
+                    shutil.copy2(str(source), str(destination))
+                    source.unlink()
+
+        try:
+            ensure_dir_cached(destination.parent)
+            await asyncio.to_thread(_move)
+            logging.debug(f"Moved file from {source} to {destination}")
+
+        except Exception as e:
+            logging.error(f"Failed to move file from {source} to {destination}: {e}")
+            raise
+
 def create_kb_path(category: str, subcategory: str, name: str) -> Path:
     """Create a knowledge base item path."""
     normalizer = PathNormalizer()
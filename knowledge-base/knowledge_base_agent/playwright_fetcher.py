@@ -37,15 +37,14 @@ class PlaywrightFetcher:
     
     def __init__(self, config: Config):
         self.config = config
+        self.playwright = None
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
-        self._lock = asyncio.Lock()  # Ensure single concurrent fetch
-        
+
     async def __aenter__(self):
         """Initialize browser for context manager."""
         await self.initialize()
         return self
-        
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Cleanup browser resources."""
         await self.cleanup()
@@ -53,10 +52,8 @@ class PlaywrightFetcher:
     async def initialize(self) -> None:
         """Initialize Playwright browser."""
         try:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(headless=True)
-            self.page = await self.browser.new_page()
-            await self.page.set_viewport_size({"width": 1280, "height": 1024})
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=True)
         except Exception as e:
             logging.error(f"Failed to initialize Playwright: {e}")
             raise FetchError(f"Playwright initialization failed: {e}")
@@ -64,13 +61,30 @@ class PlaywrightFetcher:
     async def cleanup(self) -> None:
         """Clean up Playwright resources."""
         try:
-            if self.page:
-                await self.page.close()
             if self.browser:
                 await self.browser.close()
+                self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
         except Exception as e:
             logging.error(f"Failed to cleanup Playwright resources: {e}")
 
+    async def _new_page(self) -> Page:
+        """Open a fresh page on the shared browser with heavy resources blocked."""
+        page = await self.browser.new_page()
+        await page.set_viewport_size({"width": 1280, "height": 1024})
+        # We only read src/alt attributes from the DOM, so the actual image,
+        # font, and video payloads are dead weight; stylesheets stay enabled
+        # because wait_for_selector waits for visibility
+        await page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in {"image", "font", "media"}
+            else route.continue_()
+        )
+        return page
+
     async def fetch_tweet_data(self, tweet_url: str) -> Dict[str, Any]:
         """
         Fetch tweet data including text, media URLs, and links.
@@ -81,74 +95,101 @@ class PlaywrightFetcher:
         Returns:
             Dict containing tweet text, media, and URLs
         """
-        async with self._lock:  # Ensure single concurrent fetch
-            try:
-                await self.page.goto(tweet_url, wait_until="networkidle")  # Wait for full load
-                
-                # Wait for tweet content
-                await self.page.wait_for_selector('article[data-testid="tweet"]', timeout=30000)
-                
-                # Get tweet text
-                text_elem = await self.page.query_selector('div[data-testid="tweetText"]') or \
-                            await self.page.query_selector('article div[lang]')
-                tweet_text = await text_elem.inner_text() if text_elem else ""
-                
-                # Get media (images, videos, GIFs)
-                media = set()
-                image_elems = await self.page.query_selector_all('article img[src*="twimg.com"]')
-                for img in image_elems:
-                    src = await img.get_attribute('src')
-                    if src and not any(skip in src.lower() for skip in ['profile_images', 'emoji']):
-                        high_quality_url = get_high_res_url(src)
-                        media.add((high_quality_url, 'image', await img.get_attribute('alt') or ''))
-                
-                video_elems = await self.page.query_selector_all('article video[src], article div[data-testid="videoPlayer"] video')
-                for video in video_elems:
-                    src = await video.get_attribute('src')
-                    poster = await video.get_attribute('poster')
-                    if src:
-                        media.add((src, 'video', ''))
-                    if poster:
-                        high_quality_poster = get_high_res_url(poster)
-                        media.add((high_quality_poster, 'image', ''))
-                
-                # Get URLs
-                url_elems = await self.page.query_selector_all('article a[href^="http"]')
-                urls = set()
-                for elem in url_elems:
-                    href = await elem.get_attribute('href')
-                    if href and "status" not in href and "t.co" in href:
-                        urls.add(href)
-                
-                tweet_data = {
-                    "full_text": tweet_text,
-                    "media": [{"url": url, "type": m_type, "alt_text": alt} for url, m_type, alt in media],
-                    "urls": list(urls),
-                    "downloaded_media": []  # Will be populated during media download
-                }
-                logging.info(f"Fetched tweet {tweet_url}: {len(urls)} URLs, {len(media)} media items")
-                return tweet_data
-                
-            except PlaywrightTimeout:
-                logging.error(f"Timeout while fetching tweet {tweet_url}")
-                raise FetchError(f"Timeout while fetching tweet {tweet_url}")
-            except Exception as e:
-                logging.error(f"Failed to fetch tweet {tweet_url}: {e}")
-                raise FetchError(f"Failed to fetch tweet {tweet_url}: {e}")
+        page = await self._new_page()
+        try:
+            # domcontentloaded + explicit selector wait is much faster than
+            # waiting for networkidle on a page that streams requests forever
+            await page.goto(tweet_url, wait_until="domcontentloaded")
+
+            # Wait for tweet content
+            await page.wait_for_selector('article[data-testid="tweet"]', timeout=30000)
+
+            # Get tweet text
+            text_elem = await page.query_selector('div[data-testid="tweetText"]') or \
+                        await page.query_selector('article div[lang]')
+            tweet_text = await text_elem.inner_text() if text_elem else ""
+
+            # Get media (images, videos, GIFs)
+            media = set()
+            image_elems = await page.query_selector_all('article img[src*="twimg.com"]')
+            for img in image_elems:
+                src = await img.get_attribute('src')
+                if src and not any(skip in src.lower() for skip in ['profile_images', 'emoji']):
+                    high_quality_url = get_high_res_url(src)
+                    media.add((high_quality_url, 'image', await img.get_attribute('alt') or ''))
+
+            video_elems = await page.query_selector_all('article video[src], article div[data-testid="videoPlayer"] video')
+            for video in video_elems:
+                src = await video.get_attribute('src')
+                poster = await video.get_attribute('poster')
+                if src:
+                    media.add((src, 'video', ''))
+                if poster:
+                    high_quality_poster = get_high_res_url(poster)
+                    media.add((high_quality_poster, 'image', ''))
+
+            # Get URLs
+            url_elems = await page.query_selector_all('article a[href^="http"]')
+            urls = set()
+            for elem in url_elems:
+                href = await elem.get_attribute('href')
+                if href and "status" not in href and "t.co" in href:
+                    urls.add(href)
+
+            tweet_data = {
+                "full_text": tweet_text,
+                "media": [{"url": url, "type": m_type, "alt_text": alt} for url, m_type, alt in media],
+                "urls": list(urls),
+                "downloaded_media": []  # Will be populated during media download
+            }
+            logging.info(f"Fetched tweet {tweet_url}: {len(urls)} URLs, {len(media)} media items")
+            return tweet_data
+
+        except PlaywrightTimeout:
+            logging.error(f"Timeout while fetching tweet {tweet_url}")
+            raise FetchError(f"Timeout while fetching tweet {tweet_url}")
+        except Exception as e:
+            logging.error(f"Failed to fetch tweet {tweet_url}: {e}")
+            raise FetchError(f"Failed to fetch tweet {tweet_url}: {e}")
+        finally:
+            await page.close()
+
+# Shared fetcher so all tweet fetches reuse one Chromium instance instead of
+# paying browser startup per tweet; pages are created per fetch
+_shared_fetcher: Optional[PlaywrightFetcher] = None
+_shared_fetcher_lock = asyncio.Lock()
+
+async def get_playwright_fetcher(config: Config) -> PlaywrightFetcher:
+    """Return the shared PlaywrightFetcher, starting the browser on first use."""
+    global _shared_fetcher
+    async with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            fetcher = PlaywrightFetcher(config)
+            await fetcher.initialize()
+            _shared_fetcher = fetcher
+        return _shared_fetcher
+
+async def close_playwright_fetcher() -> None:
+    """Shut down the shared browser, if one was started."""
+    global _shared_fetcher
+    async with _shared_fetcher_lock:
+        if _shared_fetcher is not None:
+            await _shared_fetcher.cleanup()
+            _shared_fetcher = None
 
 async def fetch_tweet_data_playwright(tweet_url: str, config: Config) -> Dict[str, Any]:
     """
-    Convenience function to fetch tweet data using PlaywrightFetcher.
-    
+    Convenience function to fetch tweet data using the shared PlaywrightFetcher.
+
     Args:
         tweet_url: URL of the tweet to fetch
         config: Config instance containing settings
-        
+
     Returns:
         Dict containing tweet text, media, and URLs
     """
-    async with PlaywrightFetcher(config) as fetcher:
-        return await fetcher.fetch_tweet_data(tweet_url)
+    fetcher = await get_playwright_fetcher(config)
+    return await fetcher.fetch_tweet_data(tweet_url)
 
 async def download_media_playwright(
     media_urls: List[str],
@@ -167,26 +208,33 @@ async def download_media_playwright(
         List of paths to downloaded media files
     """
     media_cache_dir.mkdir(parents=True, exist_ok=True)
-    downloaded_paths = []
-    
+
     async with aiohttp.ClientSession() as session:
-        for i, url in enumerate(media_urls):
-            try:
-                filename = f"{tweet_id}_media_{i}{Path(url).suffix}"
-                media_path = media_cache_dir / filename
-                
-                if media_path.exists():
-                    downloaded_paths.append(media_path)
-                    continue
-                    
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.read()
-                        media_path.write_bytes(content)
-                        downloaded_paths.append(media_path)
-                        
-            except Exception as e:
-                logging.error(f"Failed to download media from {url}: {e}")
-                continue
-                
+        async def _fetch_one(i: int, url: str) -> Optional[Path]:
+            filename = f"{tweet_id}_media_{i}{Path(url).suffix}"
+            media_path = media_cache_dir / filename
+
+            if media_path.exists():
+                return media_path
+
+            async with session.get(url) as response:
+                if response.status == 200:
+                    content = await response.read()
+                    media_path.write_bytes(content)
+                    return media_path
+            return None
+
+        # Downloads are independent; fetch them all concurrently
+        results = await asyncio.gather(
+            *(_fetch_one(i, url) for i, url in enumerate(media_urls)),
+            return_exceptions=True
+        )
+
+    downloaded_paths = []
+    for url, result in zip(media_urls, results):
+        if isinstance(result, Exception):
+            logging.error(f"Failed to download media from {url}: {result}")
+        elif result:
+            downloaded_paths.append(result)
+
     return downloaded_paths
\ No newline at end of file
@@ -1,11 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 import logging
 
-@dataclass
+from knowledge_base_agent.file_utils import json_dumps
+
+@dataclass(slots=True)
 class ProcessingStats:
     """Track progress of content processing."""
     start_time: datetime = field(default_factory=datetime.now)
@@ -20,25 +21,14 @@ class ProcessingStats:
     cache_misses: int = 0
     network_errors: int = 0
     retry_count: int = 0
-    processing_times: List[float] = field(default_factory=list)
+    # Running accumulators; the per-operation durations themselves are not
+    # kept, so memory stays constant over arbitrarily long runs
+    processing_time_count: int = 0
+    processing_time_sum: float = 0.0
+    processing_time_min: float = 0.0
+    processing_time_max: float = 0.0
     validation_count: int = 0
 
-    def __init__(self, start_time: datetime):
-        self.start_time = start_time
-        self.processed_count = 0
-        self.success_count = 0
-        self.error_count = 0
-        self.media_processed = 0
-        self.categories_processed = 0
-        self.readme_generated = False
-        self.validation_count = 0
-        self.skipped_count = 0
-        self.cache_hits = 0
-        self.cache_misses = 0
-        self.network_errors = 0
-        self.retry_count = 0
-        self.processing_times = []  # Explicitly initialize
-
     def __str__(self) -> str:
         return (
             f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}, "
@@ -78,8 +68,7 @@ class ProcessingStats:
         try:
             report = self.to_dict()
             report['duration'] = str(datetime.now() - self.start_time)
-            with output_path.open('w') as f:
-                json.dump(report, f, indent=2)
+            output_path.write_text(json_dumps(report), encoding='utf-8')
             logging.debug(f"Saved stats report to {output_path}")
         except Exception as e:
             logging.error(f"Failed to save stats report: {e}")
@@ -91,17 +80,22 @@ class ProcessingStats:
             'error_rate': f"{(self.error_count / self.processed_count * 100):.1f}%" if self.processed_count else "0.0%",
             'average_retries': self.retry_count / self.processed_count if self.processed_count else 0
         }
-        if self.processing_times:  # Check if list is populated
+        if self.processing_time_count:
             metrics.update({
-                'avg_processing_time': f"{sum(self.processing_times) / len(self.processing_times):.2f}s",
-                'max_processing_time': f"{max(self.processing_times):.2f}s",
-                'min_processing_time': f"{min(self.processing_times):.2f}s"
+                'avg_processing_time': f"{self.processing_time_sum / self.processing_time_count:.2f}s",
+                'max_processing_time': f"{self.processing_time_max:.2f}s",
+                'min_processing_time': f"{self.processing_time_min:.2f}s"
             })
         return metrics
 
     def add_processing_time(self, duration: float) -> None:
-        """Add processing time for a single operation."""
-        self.processing_times.append(duration)
+        """Fold one operation's duration into the running accumulators."""
+        if self.processing_time_count == 0 or duration < self.processing_time_min:
+            self.processing_time_min = duration
+        if duration > self.processing_time_max:
+            self.processing_time_max = duration
+        self.processing_time_sum += duration
+        self.processing_time_count += 1
 
 @dataclass
 class ProcessingResult:
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import Callable, Any, Dict
 import logging
@@ -45,23 +46,28 @@ def check_knowledge_base_state(config) -> Dict[str, bool]:
     
     return state
 
-def prompt_for_preferences(config: Config) -> UserPreferences:
+async def _ask(prompt: str) -> bool:
+    """Prompt for a y/n answer without blocking the event loop."""
+    answer = await asyncio.to_thread(input, prompt)
+    return answer.lower().startswith('y')
+
+async def prompt_for_preferences(config: Config) -> UserPreferences:
     """Prompt user for processing preferences."""
     kb_state = check_knowledge_base_state(config)
     prefs = UserPreferences()
-    
+
     # Always prompt for bookmarks update
-    prefs.update_bookmarks = input("Fetch new bookmarks? (y/n): ").lower().startswith('y')
-    
+    prefs.update_bookmarks = await _ask("Fetch new bookmarks? (y/n): ")
+
     # Only prompt for review if we have processed tweets
     if kb_state['has_processed_tweets']:
-        prefs.review_existing = input("Re-process previously processed tweets? (y/n): ").lower().startswith('y')
+        prefs.review_existing = await _ask("Re-process previously processed tweets? (y/n): ")
     else:
         prefs.review_existing = False
-    
+
     # Only prompt for cache refresh if there is cached data
     if kb_state['has_cached_tweets']:
-        prefs.recreate_tweet_cache = input("Re-cache all tweet data? (y/n): ").lower().startswith('y')
+        prefs.recreate_tweet_cache = await _ask("Re-cache all tweet data? (y/n): ")
     
     # README generation is automatic if it doesn't exist
     prefs.regenerate_readme = not kb_state['has_readme']
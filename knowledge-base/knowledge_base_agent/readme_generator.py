@@ -1,5 +1,7 @@
 from pathlib import Path
 from typing import Dict, Any, List
+import asyncio
+import functools
 import logging
 import aiofiles
 import re
@@ -8,11 +10,28 @@ from knowledge_base_agent.category_manager import CategoryManager
 from knowledge_base_agent.http_client import HTTPClient
 from knowledge_base_agent.exceptions import MarkdownGenerationError
 from knowledge_base_agent.config import Config
+from knowledge_base_agent.file_utils import async_write_text
 import json
 import os
 import shutil
 from knowledge_base_agent.pages_generator import generate_github_pages
 
+@functools.lru_cache(maxsize=1024)
+def _format_day(mtime: float) -> str:
+    """Format an mtime as YYYY-MM-DD; strftime's locale machinery is paid once per timestamp."""
+    return datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
+
+def count_media_files(kb_dir: Path) -> int:
+    """Count media files under the KB tree in a single pruned walk."""
+    total = 0
+    for root, dirs, files in os.walk(kb_dir):
+        # Prune hidden directories (.git and friends) so the walk doesn't
+        # descend into them just to reject every file
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        total += sum(1 for file in files
+                     if file.startswith('image_') or file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')))
+    return total
+
 async def generate_root_readme(kb_dir: Path, category_manager: CategoryManager, http_client: HTTPClient, config: Config) -> None:
     """Generate a hybrid README.md using both static generation and LLM enhancement."""
     logging.info(f"Generating root README for knowledge base at {kb_dir}...")
@@ -104,7 +123,7 @@ async def generate_root_readme(kb_dir: Path, category_manager: CategoryManager,
                         'sub_category': sub_cat,
                         'item_name': item_name,
                         'path': item_path,
-                        'description': await get_item_description(readme_path),
+                        'readme_path': readme_path,
                         'last_updated': readme_path.stat().st_mtime,
                         'tweet_id': tweet_id,
                         'created_date': tweet_data.get('processed_date'),
@@ -114,6 +133,8 @@ async def generate_root_readme(kb_dir: Path, category_manager: CategoryManager,
                     logging.error(f"Error processing KB item {kb_path_str} for tweet {tweet_id}: {e}")
                     continue
 
+        await attach_item_descriptions(kb_items)
+
         logging.info(f"Validated {len(kb_items)} KB items (from cache: {len([t for t in tweet_cache.values() if t.get('kb_item_created', False)])})")
         
         # Log item names for debugging
@@ -121,11 +142,11 @@ async def generate_root_readme(kb_dir: Path, category_manager: CategoryManager,
         for item in kb_items:
             logging.debug(f"- {item['item_name'].replace('-', ' ').title()}")
         
+        # Calculated once here and reused for the overview section below
         total_items = len(kb_items)
         total_main_cats = len(set(item['main_category'] for item in kb_items))
         total_subcats = len(set(f"{item['main_category']}/{item['sub_category']}" for item in kb_items))
-        total_media = sum(1 for root, _, files in os.walk(kb_dir)
-                         for file in files if file.startswith('image_') or file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')))
+        total_media = count_media_files(kb_dir)
         logging.debug(f"Collected {total_items} items, {total_main_cats} main categories, {total_subcats} subcategories, {total_media} media files")
         logging.debug("First 5 KB items paths:")
         for item in kb_items[:5]:
@@ -141,14 +162,7 @@ async def generate_root_readme(kb_dir: Path, category_manager: CategoryManager,
             if sub_cat not in categories[main_cat]['subcategories']:
                 categories[main_cat]['subcategories'][sub_cat] = []
             categories[main_cat]['subcategories'][sub_cat].append(item)
-        
-        # Calculate statistics
-        total_items = len(kb_items)
-        total_main_cats = len(set(item['main_category'] for item in kb_items))
-        total_subcats = len(set(f"{item['main_category']}/{item['sub_category']}" for item in kb_items))
-        total_media = sum(1 for root, _, files in os.walk(kb_dir)
-                         for file in files if file.startswith('image_') or file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')))
-        
+
         # Generate the static structure first (reliable)
         static_content = [
             "# 📚 Technical Knowledge Base",
@@ -189,7 +203,7 @@ async def generate_root_readme(kb_dir: Path, category_manager: CategoryManager,
                 name = item['item_name'].replace('-', ' ').title()
                 path = f"{item['path']}"
                 cat = f"{item['main_category'].title()}/{item['sub_category'].title()}"
-                updated = datetime.fromtimestamp(item['last_updated']).strftime('%Y-%m-%d')
+                updated = _format_day(item['last_updated'])
                 source = item.get('source_url', 'N/A')
                 static_content.append(f"| [{name}]({path}) | {cat} | {updated} | [{source}]({source}) |")
 
@@ -297,9 +311,8 @@ Keep it concise and informative."""
         
         # Write to file
         readme_path = kb_dir / "README.md"
-        async with aiofiles.open(readme_path, 'w', encoding='utf-8') as f:
-            await f.write(final_content)
-        
+        await async_write_text(final_content, readme_path)
+
         logging.info("Generated hybrid root README.md")
         
         # Verify links
@@ -319,8 +332,7 @@ Keep it concise and informative."""
         try:
             content = await generate_static_root_readme(kb_dir, category_manager)
             readme_path = kb_dir / "README.md"
-            async with aiofiles.open(readme_path, 'w', encoding='utf-8') as f:
-                await f.write(content)
+            await async_write_text(content, readme_path)
             logging.info("Generated static README as fallback")
         except Exception as fallback_error:
             logging.error(f"Failed to generate static README: {fallback_error}")
@@ -367,7 +379,7 @@ async def generate_static_root_readme(kb_dir: Path, category_manager: CategoryMa
                     'sub_category': sub_cat,
                     'item_name': item_name,
                     'path': item_path,
-                    'description': await get_item_description(readme_path),
+                    'readme_path': readme_path,
                     'last_updated': readme_path.stat().st_mtime
                 })
     
@@ -406,10 +418,11 @@ async def generate_static_root_readme(kb_dir: Path, category_manager: CategoryMa
                         'sub_category': sub_cat,
                         'item_name': item_name,
                         'path': item_path,
-                        'description': await get_item_description(md_path),
+                        'readme_path': md_path,
                         'last_updated': md_path.stat().st_mtime
                     })
-    
+
+    await attach_item_descriptions(kb_items)
     logging.info(f"Found {len(kb_items)} KB items for static README")
     
     categories = {}
@@ -425,8 +438,7 @@ async def generate_static_root_readme(kb_dir: Path, category_manager: CategoryMa
     total_items = len(kb_items)
     total_main_cats = len(categories)
     total_subcats = len(set(f"{item['main_category']}/{item['sub_category']}" for item in kb_items))
-    total_media = sum(1 for root, _, files in os.walk(kb_dir)
-                     for file in files if file.startswith('image_') or file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')))
+    total_media = count_media_files(kb_dir)
     logging.debug(f"Static README stats: {total_items} items, {total_main_cats} main categories, {total_subcats} subcategories, {total_media} media files")
 
     content = [
@@ -464,7 +476,7 @@ async def generate_static_root_readme(kb_dir: Path, category_manager: CategoryMa
             name = item['item_name'].replace('-', ' ').title()
             path = f"{item['path']}"
             cat = f"{item['main_category'].title()}/{item['sub_category'].title()}"
-            updated = datetime.fromtimestamp(item['last_updated']).strftime('%Y-%m-%d')
+            updated = _format_day(item['last_updated'])
             source = item.get('source_url', 'N/A')
             content.append(f"| [{name}]({path}) | {cat} | {updated} | [{source}]({source}) |")
             logging.debug(f"Added recent item to static README: {name}")
@@ -509,6 +521,26 @@ async def generate_static_root_readme(kb_dir: Path, category_manager: CategoryMa
 
     return '\n'.join(content)
 
+async def attach_item_descriptions(kb_items: List[Dict[str, Any]], max_concurrent: int = 16) -> None:
+    """Fill in item descriptions with bounded concurrency.
+
+    Each description is an independent small file read; fetching them one at
+    a time made README generation O(items) round trips to disk. The semaphore
+    keeps the number of simultaneously open files modest.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _describe(readme_path: Path) -> str:
+        async with semaphore:
+            return await get_item_description(readme_path)
+
+    descriptions = await asyncio.gather(
+        *(_describe(item['readme_path']) for item in kb_items)
+    )
+    for item, description in zip(kb_items, descriptions):
+        item['description'] = description
+        del item['readme_path']
+
 async def get_item_description(readme_path: Path) -> str:
     """Extract a polished description from a knowledge base item's README."""
     try:
@@ -531,16 +563,24 @@ async def get_item_description(readme_path: Path) -> str:
         logging.warning(f"Failed to get description from {readme_path}: {e}")
         return "Description unavailable"
 
+# Built once; replaces the chain of str.replace calls (each of which
+# allocated a full copy of the cell text) with a single translate pass
+_MARKDOWN_CELL_TRANS = str.maketrans({
+    '\n': ' ',
+    '\r': ' ',
+    '|': '\\|',
+    '[': '\\[',
+    ']': '\\]',
+    '*': '\\*',
+})
+
 def sanitize_markdown_cell(text: str) -> str:
     """Escape special characters for markdown tables."""
     if not text:
         logging.debug("Sanitizing empty text; returning default")
         return "No description available"
-    
-    text = text.replace('\n', ' ').replace('\r', ' ')
-    text = text.replace('|', '\\|')
-    text = text.replace('[', '\\[').replace(']', '\\]')
-    text = text.replace('*', '\\*')
+
+    text = text.translate(_MARKDOWN_CELL_TRANS)
     if len(text) > 200:
         text = text[:197] + "..."
     logging.debug(f"Sanitized markdown cell: {text[:50]}...")
@@ -587,8 +627,7 @@ def generate_overview_section(kb_items: List[Dict[str, Any]], kb_dir: Path) -> s
     total_items = len(kb_items)
     main_categories = set(item['main_category'] for item in kb_items)
     subcategories = set(f"{item['main_category']}/{item['sub_category']}" for item in kb_items)
-    media_files = sum(1 for root, _, files in os.walk(kb_dir)
-                     for file in files if file.startswith('image_') or file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')))
+    media_files = count_media_files(kb_dir)
     
     now = datetime.now()
     date_str = now.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,69 @@
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+class ResponseCache:
+    """Persistent cache for LLM responses, keyed by a hash of the model,
+    prompt, and generation parameters.
+
+    Backed by sqlite in WAL mode so lookups stay fast once the cache outgrows
+    RAM and entries survive restarts. Cache failures are logged and treated as
+    misses — the cache must never break generation.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.cache_path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value BLOB, ts INTEGER)"
+        )
+        logging.info(f"Initialized response cache at {self.cache_path}")
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float, max_tokens: int, top_p: float) -> bytes:
+        """Build a stable binary key from the model, prompt, and sampling params.
+
+        The generation parameters are part of the key so a response produced
+        under one temperature/top_p is never replayed for a request made
+        under another.
+        """
+        material = f"{model}\x00{prompt}\x00{temperature}\x00{max_tokens}\x00{top_p}"
+        return hashlib.sha256(material.encode('utf-8')).digest()
+
+    def get(self, model: str, prompt: str, temperature: float, max_tokens: int, top_p: float) -> Optional[str]:
+        """Return the cached response for this request, or None on miss."""
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ?",
+                (self.make_key(model, prompt, temperature, max_tokens, top_p),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache lookup failed: {e}")
+            return None
+        if row is None:
+            return None
+        return row[0].decode('utf-8')
+
+    def set(self, model: str, prompt: str, temperature: float, max_tokens: int, top_p: float, response: str) -> None:
+        """Store a response, replacing any previous entry for the same key."""
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (self.make_key(model, prompt, temperature, max_tokens, top_p),
+                 response.encode('utf-8'), int(time.time()))
+            )
+        except sqlite3.Error as e:
+            logging.warning(f"Response cache write failed: {e}")
+
+    def close(self) -> None:
+        """Close the underlying sqlite connection."""
+        try:
+            self._conn.close()
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to close response cache: {e}")
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import asyncio
 import aiofiles
@@ -9,11 +10,18 @@ import tempfile
 import os
 import shutil
 from knowledge_base_agent.config import Config
-from knowledge_base_agent.file_utils import async_write_text, async_json_load, async_json_dump
+from knowledge_base_agent.file_utils import async_write_text, async_json_load, async_json_dump, json_dumps, json_loads
 from knowledge_base_agent.tweet_utils import parse_tweet_id_from_url, load_tweet_urls_from_links
 from datetime import datetime
 
+# Labels for the completion bitmask checked in mark_tweet_processed, in bit order
+_MISSING_STEP_LABELS = ('media_processed', 'categories_processed', 'kb_item_created', 'kb_item_path')
+
 class StateManager:
+    # Rewrite the unprocessed list after this many processed marks rather
+    # than on every mark; flush() forces the write at phase boundaries
+    _FLUSH_INTERVAL = 50
+
     def __init__(self, config: Config):
         """Initialize the state manager."""
         self.config = config
@@ -21,6 +29,9 @@ class StateManager:
         self.unprocessed_file = config.unprocessed_tweets_file
         self.bookmarks_file = config.bookmarks_file
         self.processed_tweets_file = Path(config.processed_tweets_file)
+        # Append-only log of processed marks; compacted into the JSON file
+        # on the next initialize
+        self.processed_wal_file = self.processed_tweets_file.with_suffix('.jsonl')
         self.tweet_cache_file = Path(config.tweet_cache_file)
         self.unprocessed_tweets_file = Path(config.unprocessed_tweets_file)
         self._processed_tweets = {}
@@ -28,6 +39,11 @@ class StateManager:
         self._unprocessed_tweets = []
         self._initialized = False
         self._lock = asyncio.Lock()
+        self._batch_depth = 0
+        self._dirty_files: Set[Path] = set()
+        self._marks_since_flush = 0
+        self._wal_handle = None
+        self._last_write_hash: Dict[Path, str] = {}
         self.validation_fixes = 0  # Add counter for validation fixes
 
     @property
@@ -53,13 +69,15 @@ class StateManager:
         self.processed_tweets_file.parent.mkdir(parents=True, exist_ok=True)
         self.unprocessed_tweets_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Each state file is loaded with one read_bytes in a worker thread
+        # and parsed by the orjson-backed helper, instead of aiofiles'
+        # per-operation thread hops plus a stdlib parse
+
         # Load unprocessed tweets
         if self.unprocessed_tweets_file.exists():
             try:
-                async with aiofiles.open(self.unprocessed_tweets_file, 'r') as f:
-                    content = await f.read()
-                    tweet_ids = json.loads(content) if content.strip() else []
-                    self._unprocessed_tweets = tweet_ids
+                content = await asyncio.to_thread(self.unprocessed_tweets_file.read_bytes)
+                self._unprocessed_tweets = json_loads(content) if content.strip() else []
                 logging.info(f"Loaded {len(self._unprocessed_tweets)} unprocessed tweets")
             except Exception as e:
                 logging.error(f"Error loading unprocessed tweets: {e}")
@@ -68,21 +86,43 @@ class StateManager:
         # Load processed tweets
         if self.processed_tweets_file.exists():
             try:
-                async with aiofiles.open(self.processed_tweets_file, 'r') as f:
-                    content = await f.read()
-                    processed_data = json.loads(content) if content.strip() else {}
-                    self._processed_tweets = {k: v for k, v in processed_data.items()}
+                content = await asyncio.to_thread(self.processed_tweets_file.read_bytes)
+                self._processed_tweets = json_loads(content) if content.strip() else {}
                 logging.info(f"Loaded {len(self._processed_tweets)} processed tweets")
             except Exception as e:
                 logging.error(f"Error loading processed tweets: {e}")
                 self._processed_tweets = {}
 
+        # Replay any processed marks appended since the last compaction and
+        # fold them into the main JSON file. Appending one line per tweet
+        # keeps mark_tweet_processed O(1) instead of rewriting the whole
+        # processed file per tweet; the full rewrite happens once, here.
+        if self.processed_wal_file.exists():
+            try:
+                if self._wal_handle is not None:
+                    self._wal_handle.close()
+                    self._wal_handle = None
+                replayed = 0
+                wal_content = await asyncio.to_thread(self.processed_wal_file.read_text, encoding='utf-8')
+                for line in wal_content.splitlines():
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json_loads(line)
+                    self._processed_tweets[entry['tweet_id']] = entry['processed_at']
+                    replayed += 1
+                if replayed:
+                    await self._atomic_write_json(self._processed_tweets, self.processed_tweets_file)
+                    logging.info(f"Replayed {replayed} processed marks from log and compacted")
+                self.processed_wal_file.unlink()
+            except Exception as e:
+                logging.error(f"Error replaying processed-tweets log: {e}")
+
         # Load tweet cache
         if self.tweet_cache_file.exists():
             try:
-                async with aiofiles.open(self.tweet_cache_file, 'r') as f:
-                    content = await f.read()
-                    self._tweet_cache = json.loads(content) if content.strip() else {}
+                content = await asyncio.to_thread(self.tweet_cache_file.read_bytes)
+                self._tweet_cache = json_loads(content) if content.strip() else {}
                 logging.info(f"Loaded {len(self._tweet_cache)} cached tweets")
             except Exception as e:
                 logging.error(f"Error loading tweet cache: {e}")
@@ -96,7 +136,10 @@ class StateManager:
         logging.info("Reconciling tweet states across processed and unprocessed lists...")
         tweets_to_process = set()
         tweets_to_mark_processed = set()
-        
+        # One timestamp for the whole reconciliation pass; per-tweet clock
+        # reads add nothing but syscall overhead
+        reconciled_at = datetime.now().isoformat()
+
         # First, ensure all cached tweets are either in processed or unprocessed
         for tweet_id in self._tweet_cache:
             if tweet_id not in self._processed_tweets and tweet_id not in self._unprocessed_tweets:
@@ -110,7 +153,7 @@ class StateManager:
             if is_fully_processed:
                 if tweet_id not in self._processed_tweets:
                     tweets_to_mark_processed.add(tweet_id)
-                    self._processed_tweets[tweet_id] = datetime.now().isoformat()
+                    self._processed_tweets[tweet_id] = reconciled_at
                     logging.info(f"Tweet {tweet_id} validated as fully processed, moving to processed")
                 
                 # Ensure it's removed from unprocessed list
@@ -165,14 +208,16 @@ class StateManager:
         logging.info(f"Found {len(all_kb_items)} KB items in {kb_dir}")
         orphans = all_kb_items - valid_kb_paths
 
+        # Tree removals block for the full disk latency; run them in worker
+        # threads so initialization doesn't stall the event loop
         for tweet_id, paths in duplicates.items():
             old_path = [p for p in paths if p != tweet_to_path[tweet_id]][0]
             logging.debug(f"Removing duplicate KB item for tweet {tweet_id}: {old_path}")
-            shutil.rmtree(old_path, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, old_path, ignore_errors=True)
 
         for orphan_path in orphans:
             logging.debug(f"Removing orphaned KB item: {orphan_path}")
-            shutil.rmtree(orphan_path, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, orphan_path, ignore_errors=True)
 
         logging.info(f"Removed {len(orphans)} orphaned KB items and handled {len(duplicates)} duplicates")
         if tweets_to_process or tweets_to_mark_processed or duplicates or orphans:
@@ -184,16 +229,72 @@ class StateManager:
 
         self._initialized = True
 
+    def begin_batch(self) -> None:
+        """Defer state-file writes until commit_batch.
+
+        While batching, updates still land in the in-memory structures
+        immediately; only the per-update rewrite of the JSON files is
+        deferred, so a phase touching N tweets costs one write per dirty
+        file instead of N.
+
+        Batches nest: a depth counter means an inner begin/commit pair
+        (e.g. cache_tweets called from inside a processing phase) leaves
+        the outer batch in effect, and only the outermost commit flushes.
+        """
+        self._batch_depth += 1
+
+    async def commit_batch(self) -> None:
+        """Flush all state files dirtied since the outermost begin_batch."""
+        if self._batch_depth > 0:
+            self._batch_depth -= 1
+        if self._batch_depth:
+            # An enclosing batch is still open; it will flush on its commit
+            return
+        dirty, self._dirty_files = self._dirty_files, set()
+        for filepath in dirty:
+            if filepath == self.tweet_cache_file:
+                await self._atomic_write_json(self._tweet_cache, filepath)
+            elif filepath == self.processed_tweets_file:
+                await self._atomic_write_json(self._processed_tweets, filepath)
+            elif filepath == self.unprocessed_tweets_file:
+                await self._atomic_write_json(list(self._unprocessed_tweets), filepath)
+        if dirty:
+            logging.debug(f"Committed batched state writes: {[str(p) for p in dirty]}")
+
     async def _atomic_write_json(self, data: Any, filepath: Path) -> None:
         """Write JSON data atomically using a temporary file."""
+        if self._batch_depth:
+            # Deferred until commit_batch; in-memory state is already current
+            self._dirty_files.add(filepath)
+            return
+        serialized = json_dumps(data)
+        content_hash = hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+        if self._last_write_hash.get(filepath) == content_hash:
+            # Identical to what we last wrote; no reason to touch the disk
+            logging.debug(f"State file unchanged, skipping write: {filepath}")
+            return
         temp_file = None
         try:
             temp_fd, temp_path = tempfile.mkstemp(dir=filepath.parent)
             os.close(temp_fd)
             temp_file = Path(temp_path)
             async with aiofiles.open(temp_file, 'w') as f:
-                await f.write(json.dumps(data, indent=2))
-            shutil.move(str(temp_file), str(filepath))
+                await f.write(serialized)
+
+            def _replace() -> None:
+                # Temp file and destination share a directory, so this is a
+                # single rename syscall — no stat or copy fallback as with
+                # shutil.move. The parent-directory fsync makes the rename
+                # itself durable, not just the file contents.
+                os.replace(temp_file, filepath)
+                dir_fd = os.open(filepath.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+
+            await asyncio.to_thread(_replace)
+            self._last_write_hash[filepath] = content_hash
             logging.debug(f"Updated state file: {filepath}")
         except Exception as e:
             if temp_file and temp_file.exists():
@@ -201,6 +302,22 @@ class StateManager:
             logging.error(f"Failed to write state file {filepath}: {e}")
             raise StateError(f"Failed to write state file: {filepath}") from e
 
+    async def _append_processed_mark(self, tweet_id: str, processed_at: str) -> None:
+        """Append one processed mark to the JSONL log.
+
+        The append handle is opened once per run and kept open, so each mark
+        costs a single write+flush instead of an open/write/close cycle.
+        """
+        if self._wal_handle is None:
+            self._wal_handle = open(self.processed_wal_file, 'a', encoding='utf-8')
+        line = json.dumps({'tweet_id': tweet_id, 'processed_at': processed_at}) + '\n'
+
+        def _write() -> None:
+            self._wal_handle.write(line)
+            self._wal_handle.flush()
+
+        await asyncio.to_thread(_write)
+
     async def mark_tweet_processed(self, tweet_id: str, tweet_data: Dict[str, Any] = None) -> None:
         """Mark a tweet as processed and remove from unprocessed list."""
         async with self._lock:
@@ -213,33 +330,39 @@ class StateManager:
                     logging.debug(f"Tweet {tweet_id} already marked as processed, skipping")
                     return
 
-                required_checks = [
-                    tweet_data.get('media_processed', not bool(tweet_data.get('media', []))),
-                    tweet_data.get('categories_processed', False),
-                    tweet_data.get('kb_item_created', False),
-                    tweet_data.get('kb_item_path', None) is not None
-                ]
-                
-                if not all(required_checks):
-                    missing_steps = [
-                        "media_processed" if not required_checks[0] else "",
-                        "categories_processed" if not required_checks[1] else "",
-                        "kb_item_created" if not required_checks[2] else "",
-                        "kb_item_path" if not required_checks[3] else ""
-                    ]
-                    logging.warning(f"Tweet {tweet_id} not fully processed. Missing steps: {', '.join(filter(None, missing_steps))}")
+                missing_mask = 0
+                if not tweet_data.get('media_processed', not bool(tweet_data.get('media', []))):
+                    missing_mask |= 1
+                if not tweet_data.get('categories_processed', False):
+                    missing_mask |= 1 << 1
+                if not tweet_data.get('kb_item_created', False):
+                    missing_mask |= 1 << 2
+                if tweet_data.get('kb_item_path', None) is None:
+                    missing_mask |= 1 << 3
+
+                if missing_mask:
+                    missing_steps = ', '.join(
+                        label for bit, label in enumerate(_MISSING_STEP_LABELS)
+                        if missing_mask & (1 << bit)
+                    )
+                    logging.warning(f"Tweet {tweet_id} not fully processed. Missing steps: {missing_steps}")
                     return
 
-                self._processed_tweets[tweet_id] = datetime.now().isoformat()
+                processed_at = datetime.now().isoformat()
+                self._processed_tweets[tweet_id] = processed_at
                 if tweet_id in self._unprocessed_tweets:
                     self._unprocessed_tweets.remove(tweet_id)
                     logging.debug(f"Removed tweet {tweet_id} from unprocessed list")
                 else:
                     logging.debug(f"Tweet {tweet_id} not in unprocessed list")
 
-                # Persist changes immediately
-                await self._atomic_write_json(list(self._unprocessed_tweets), self.unprocessed_tweets_file)
-                await self._atomic_write_json(self._processed_tweets, self.processed_tweets_file)
+                # Persist: one appended line for the processed mark; the
+                # unprocessed list is rewritten every _FLUSH_INTERVAL marks
+                # (and at flush()) instead of per tweet
+                await self._append_processed_mark(tweet_id, processed_at)
+                self._marks_since_flush += 1
+                if self._marks_since_flush >= self._FLUSH_INTERVAL:
+                    await self.flush()
                 logging.info(f"Marked tweet {tweet_id} as fully processed; unprocessed remaining: {len(self._unprocessed_tweets)}")
 
             except Exception as e:
@@ -248,6 +371,13 @@ class StateManager:
                     self._unprocessed_tweets.append(tweet_id)
                 raise StateError(f"Failed to update processing state: {e}")
 
+    async def flush(self) -> None:
+        """Persist the unprocessed list if any marks accumulated since the last write."""
+        if self._marks_since_flush:
+            self._marks_since_flush = 0
+            await self._atomic_write_json(list(self._unprocessed_tweets), self.unprocessed_tweets_file)
+            logging.debug("Flushed unprocessed tweet list")
+
     async def get_unprocessed_tweets(self) -> List[str]:
         """Get list of unprocessed tweet IDs and reconcile with cache."""
         if not self._initialized:
@@ -255,11 +385,25 @@ class StateManager:
         logging.debug(f"Returning {len(self._unprocessed_tweets)} unprocessed tweet IDs")
         return list(self._unprocessed_tweets)
 
+    async def is_tweet_processed(self, tweet_id: str) -> bool:
+        """Check whether a tweet has already been processed.
+
+        A plain dict membership test — atomic in CPython, so no lock is
+        taken; the lock only guards the write path in mark_tweet_processed.
+        """
+        return tweet_id in self._processed_tweets
+
     async def clear_state(self) -> None:
         """Clear all state (useful for testing or reset)."""
         async with self._lock:
             self._processed_tweets.clear()
             self._unprocessed_tweets.clear()
+            # Drop the processed-marks log too, or the next initialize
+            # would replay the stale marks and resurrect the cleared set
+            if self._wal_handle is not None:
+                self._wal_handle.close()
+                self._wal_handle = None
+            self.processed_wal_file.unlink(missing_ok=True)
             await self._atomic_write_json({}, self.processed_tweets_file)
             await self._atomic_write_json([], self.unprocessed_tweets_file)
             logging.info("Cleared all state")
@@ -268,9 +412,10 @@ class StateManager:
         """Update unprocessed tweets from bookmarks file."""
         try:
             tweet_urls = load_tweet_urls_from_links(self.config.bookmarks_file)
-            tweet_ids = [parse_tweet_id_from_url(url) for url in tweet_urls]
-            valid_ids = [tid for tid in tweet_ids if tid]
-            new_tweets = set(valid_ids) - set(self._processed_tweets.keys())
+            # Parse each URL once and diff against the dict's keys view
+            # directly rather than materializing intermediate lists/sets
+            valid_ids = {tid for tid in map(parse_tweet_id_from_url, tweet_urls) if tid}
+            new_tweets = valid_ids - self._processed_tweets.keys()
             
             async with self._lock:
                 self._unprocessed_tweets.extend(new_tweets)
@@ -411,7 +556,9 @@ class StateManager:
     async def mark_media_processed(self, tweet_id: str) -> None:
         """Mark media as processed for a tweet."""
         try:
-            tweet_data = await self.get_tweet(tweet_id)
+            # Inline the cache lookup; get_tweet adds an await and a debug
+            # record per call in what is a hot per-tweet path
+            tweet_data = self._tweet_cache.get(tweet_id)
             if tweet_data:
                 tweet_data['media_processed'] = True
                 await self.update_tweet_data(tweet_id, tweet_data)
@@ -423,7 +570,7 @@ class StateManager:
     async def mark_categories_processed(self, tweet_id: str) -> None:
         """Mark categories as processed for a tweet."""
         try:
-            tweet_data = await self.get_tweet(tweet_id)
+            tweet_data = self._tweet_cache.get(tweet_id)
             if tweet_data:
                 tweet_data['categories_processed'] = True
                 await self.update_tweet_data(tweet_id, tweet_data)
@@ -645,8 +792,10 @@ class StateManager:
     async def finalize_processing(self) -> None:
         """Perform final validation and move completed tweets to processed list."""
         logging.info("Finalizing processing and validating tweet states...")
-        
+        await self.flush()
+
         moved_to_processed = 0
+        finalized_at = datetime.now().isoformat()
         for tweet_id in list(self._unprocessed_tweets):  # Use list to avoid modification during iteration
             tweet_data = self._tweet_cache.get(tweet_id)
             if not tweet_data:
@@ -656,7 +805,7 @@ class StateManager:
             
             is_fully_processed = await self._validate_tweet_state_comprehensive(tweet_id, tweet_data)
             if is_fully_processed:
-                self._processed_tweets[tweet_id] = datetime.now().isoformat()
+                self._processed_tweets[tweet_id] = finalized_at
                 self._unprocessed_tweets.remove(tweet_id)
                 moved_to_processed += 1
                 logging.info(f"Finalized tweet {tweet_id} and moved to processed")
@@ -672,7 +821,8 @@ class StateManager:
         
         initial_count = len(self._unprocessed_tweets)
         to_remove = []
-        
+        cleaned_at = datetime.now().isoformat()
+
         for tweet_id in self._unprocessed_tweets:
             # Remove if already in processed list
             if tweet_id in self._processed_tweets:
@@ -698,7 +848,7 @@ class StateManager:
             
             if is_fully_processed:
                 # Move to processed list
-                self._processed_tweets[tweet_id] = datetime.now().isoformat()
+                self._processed_tweets[tweet_id] = cleaned_at
                 to_remove.append(tweet_id)
                 logging.info(f"Tweet {tweet_id} is fully processed, moving to processed list")
         
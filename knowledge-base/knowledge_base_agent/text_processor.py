@@ -10,6 +10,10 @@ from knowledge_base_agent.types import CategoryInfo
 import json
 import re
 
+# Maps spaces to underscores; used after .lower() so non-ASCII input (these
+# strings come from LLM output) lowercases the same way it always did
+_CATEGORY_NORM = str.maketrans(' ', '_')
+
 async def categorize_and_name_content(
     ollama_url: str,
     text: str,
@@ -27,8 +31,8 @@ async def categorize_and_name_content(
         )
 
         # Normalize categories
-        main_cat = main_cat.lower().replace(' ', '_')
-        sub_cat = sub_cat.lower().replace(' ', '_')
+        main_cat = main_cat.lower().translate(_CATEGORY_NORM)
+        sub_cat = sub_cat.lower().translate(_CATEGORY_NORM)
         
         # Generate item name
         item_name = await category_manager.generate_item_name(
@@ -53,10 +57,15 @@ async def process_categories(
     tweet_data: Dict[str, Any],
     config: Config,
     http_client: HTTPClient,
-    state_manager: Optional[StateManager] = None
+    state_manager: Optional[StateManager] = None,
+    timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Process and assign categories to a tweet."""
-    from .media_processor import process_media_content  # Import here to avoid circular dependency
+    """Process and assign categories to a tweet.
+
+    If ``timestamp`` is provided it is used for 'categorized_at', letting
+    batch callers compute it once per phase instead of once per tweet.
+    """
+    from .media_processor import process_media_content, build_combined_text  # Import here to avoid circular dependency
     
     try:
         # Skip if already categorized
@@ -69,10 +78,8 @@ async def process_categories(
             logging.info(f"Media not yet processed for tweet {tweet_id}, processing now...")
             tweet_data = await process_media_content(tweet_data, http_client, config)
 
-        # Generate categories
-        tweet_text = tweet_data.get('full_text', '')
-        image_descriptions = tweet_data.get('image_descriptions', [])
-        combined_text = f"{tweet_text}\n\nImage Descriptions:\n" + "\n".join(image_descriptions)
+        # Generate categories, reusing the combined text cached during media processing
+        combined_text = tweet_data.get('_combined_text') or build_combined_text(tweet_data)
 
         category_manager = CategoryManager(config, http_client=http_client)
         main_cat, sub_cat, item_name = await categorize_and_name_content(
@@ -90,7 +97,7 @@ async def process_categories(
             'sub_category': sub_cat,
             'item_name': item_name,
             'model_used': config.text_model,
-            'categorized_at': datetime.now().isoformat()
+            'categorized_at': timestamp or datetime.now().isoformat()
         }
         tweet_data['categories_processed'] = True
 
@@ -158,9 +165,9 @@ async def generate_categories(tweet_text: str, tweet_id: str, http_client: HTTPC
             raise CategoryGenerationError(f"Missing required fields: {missing_fields}")
         
         # Normalize field values
-        result["category"] = result["category"].lower().replace(" ", "_")
-        result["subcategory"] = result["subcategory"].lower().replace(" ", "_")
-        result["name"] = result["name"].lower().replace(" ", "_")
+        result["category"] = result["category"].lower().translate(_CATEGORY_NORM)
+        result["subcategory"] = result["subcategory"].lower().translate(_CATEGORY_NORM)
+        result["name"] = result["name"].lower().translate(_CATEGORY_NORM)
         
         logging.info(f"Successfully generated categories: {result}")
         return CategoryInfo(**result)
@@ -1,84 +1,156 @@
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 from knowledge_base_agent.config import Config
 from knowledge_base_agent.http_client import HTTPClient
 from knowledge_base_agent.state_manager import StateManager
 from knowledge_base_agent.playwright_fetcher import fetch_tweet_data_playwright, expand_url
-from urllib.parse import urlparse
+import aiofiles.os
+import asyncio
 import json
 import os
 from typing import Tuple
 
+def _url_ext(url: str) -> str:
+    """Extension (with dot) of a URL's path component, or '' if none.
+
+    Cheaper than Path(urlparse(url).path).suffix in the per-media hot loop,
+    but matches its behaviour: the scheme://host prefix is stripped first so
+    a host TLD is never mistaken for an extension, and a leading dot on the
+    final segment (hidden-file style) doesn't count either.
+    """
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    scheme_end = path.find('//')
+    if scheme_end != -1:
+        host_end = path.find('/', scheme_end + 2)
+        if host_end == -1:
+            # Bare scheme://host with no path
+            return ''
+        path = path[host_end:]
+    dot = path.rfind('.')
+    slash = path.rfind('/')
+    return path[dot:] if slash + 1 < dot < len(path) - 1 else ''
+
 async def cache_tweets(tweet_ids: List[str], config: Config, http_client: HTTPClient, state_manager: StateManager, force_recache: bool = False) -> None:
-    """Cache tweet data including expanded URLs and all media."""
+    """Cache tweet data including expanded URLs and all media.
+
+    Tweets are cached concurrently, bounded by config.cache_concurrency, since
+    the work per tweet (Playwright fetch, URL expansion, media download) is
+    network-bound and independent.
+    """
     cached_tweets = await state_manager.get_all_tweets()
+    semaphore = asyncio.Semaphore(config.cache_concurrency)
+    # Shared across tweets: ~4 parallel streams saturates bandwidth without
+    # tripping the media host's rate limits
+    media_semaphore = asyncio.Semaphore(4)
 
-    for tweet_id in tweet_ids:
-        try:
-            existing_tweet = cached_tweets.get(tweet_id, {})
-            if not force_recache and existing_tweet and existing_tweet.get('cache_complete', False):
-                logging.info(f"Tweet {tweet_id} already fully cached, skipping...")
-                continue
+    async def _cache_one(tweet_id: str) -> None:
+        existing_tweet = cached_tweets.get(tweet_id, {})
+        if not force_recache and existing_tweet and existing_tweet.get('cache_complete', False):
+            logging.debug("Tweet %s already fully cached, skipping...", tweet_id)
+            return
+
+        tweet_data = existing_tweet if existing_tweet else {}
+        if not tweet_data or force_recache:
+            tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
+            tweet_data = await fetch_tweet_data_playwright(tweet_url, config)
+            if not tweet_data:
+                logging.error(f"Failed to fetch tweet {tweet_id}")
+                return
+
+        # Expand URLs if present and not already expanded; expansions are
+        # independent, so run them concurrently and keep gather's ordering
+        if 'urls' in tweet_data and not tweet_data.get('urls_expanded', False):
+            urls = tweet_data.get('urls', [])
+            results = await asyncio.gather(*(expand_url(url) for url in urls), return_exceptions=True)
+            expanded_urls = []
+            for url, expanded in zip(urls, results):
+                if isinstance(expanded, Exception):
+                    logging.warning(f"Failed to expand URL {url}: {expanded}")
+                    expanded_urls.append(url)
+                else:
+                    expanded_urls.append(expanded)
+            tweet_data['urls'] = expanded_urls
+            tweet_data['urls_expanded'] = True
+
+        # Download media if forced, never downloaded, or partially downloaded.
+        # Filenames are deterministic (media_{idx}{ext}), so a retry only
+        # fetches the items whose files are actually absent.
+        downloaded = tweet_data.get('downloaded_media', [])
+        media_incomplete = (
+            'media' in tweet_data and (
+                force_recache
+                or len(downloaded) < len(tweet_data['media'])
+                or not all(Path(p).exists() for p in downloaded)
+            )
+        )
+        if media_incomplete:
+            media_dir = Path(config.media_cache_dir) / tweet_id
+            # Async so concurrent cache tasks aren't serialized on directory syscalls
+            await aiofiles.os.makedirs(media_dir, exist_ok=True)
+            # One scandir instead of a stat per media item; run in a worker
+            # thread and close the iterator so the fd isn't leaked
+            def _list_existing() -> set:
+                with os.scandir(media_dir) as entries:
+                    return {entry.name for entry in entries}
 
-            tweet_data = existing_tweet if existing_tweet else {}
-            if not tweet_data or force_recache:
-                tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
-                tweet_data = await fetch_tweet_data_playwright(tweet_url, config)
-                if not tweet_data:
-                    logging.error(f"Failed to fetch tweet {tweet_id}")
-                    continue
+            existing_files = await asyncio.to_thread(_list_existing)
 
-            # Expand URLs if present and not already expanded
-            if 'urls' in tweet_data and not tweet_data.get('urls_expanded', False):
-                expanded_urls = []
-                for url in tweet_data.get('urls', []):
-                    try:
-                        expanded = await expand_url(url)
-                        expanded_urls.append(expanded)
-                    except Exception as e:
-                        logging.warning(f"Failed to expand URL {url}: {e}")
-                        expanded_urls.append(url)
-                tweet_data['urls'] = expanded_urls
-                tweet_data['urls_expanded'] = True
+            async def _download_one_media(idx: int, media_item: Any) -> Optional[str]:
+                url = media_item.get('url', '') if isinstance(media_item, dict) else str(media_item)
+                media_type = media_item.get('type', 'image') if isinstance(media_item, dict) else 'image'
+                if not url:
+                    logging.warning(f"No valid URL in media item {idx} for tweet {tweet_id}")
+                    return None
 
-            # Download media if present and not already downloaded or forced
-            if 'media' in tweet_data and (force_recache or not tweet_data.get('downloaded_media')):
-                media_dir = Path(config.media_cache_dir) / tweet_id
-                media_dir.mkdir(parents=True, exist_ok=True)
-                media_paths = []
+                ext = '.mp4' if media_type == 'video' else (_url_ext(url) or '.jpg')
+                media_path = media_dir / f"media_{idx}{ext}"
 
-                for idx, media_item in enumerate(tweet_data['media']):
-                    try:
-                        url = media_item.get('url', '') if isinstance(media_item, dict) else str(media_item)
-                        media_type = media_item.get('type', 'image') if isinstance(media_item, dict) else 'image'
-                        if not url:
-                            logging.warning(f"No valid URL in media item {idx} for tweet {tweet_id}")
-                            continue
+                if media_path.name not in existing_files:
+                    logging.debug("Downloading media from %s to %s", url, media_path)
+                    async with media_semaphore:
+                        await http_client.download_media(url, media_path)
+                    if not media_path.exists():
+                        logging.error(f"Media download failed for {url} at {media_path}")
+                        return None
+                return str(media_path)
 
-                        ext = '.mp4' if media_type == 'video' else (Path(urlparse(url).path).suffix or '.jpg')
-                        media_path = media_dir / f"media_{idx}{ext}"
+            download_results = await asyncio.gather(
+                *(_download_one_media(idx, item) for idx, item in enumerate(tweet_data['media'])),
+                return_exceptions=True
+            )
+            media_paths = []
+            for idx, result in enumerate(download_results):
+                if isinstance(result, Exception):
+                    logging.error(f"Failed to download media item {idx} for tweet {tweet_id}: {result}")
+                elif result:
+                    media_paths.append(result)
 
-                        if not media_path.exists():
-                            logging.info(f"Downloading media from {url} to {media_path}")
-                            await http_client.download_media(url, media_path)
-                            if not media_path.exists():
-                                logging.error(f"Media download failed for {url} at {media_path}")
-                                continue
-                        media_paths.append(str(media_path))
-                    except Exception as e:
-                        logging.error(f"Failed to download media item {idx} for tweet {tweet_id}: {e}")
-                        continue
+            tweet_data['downloaded_media'] = media_paths
 
-                tweet_data['downloaded_media'] = media_paths
+        tweet_data['cache_complete'] = True
+        await state_manager.update_tweet_data(tweet_id, tweet_data)
+        logging.debug("Cached tweet %s: %d URLs, %d media items",
+                      tweet_id, len(tweet_data.get('urls', [])), len(tweet_data.get('downloaded_media', [])))
 
-            tweet_data['cache_complete'] = True
-            await state_manager.update_tweet_data(tweet_id, tweet_data)
-            logging.info(f"Cached tweet {tweet_id}: {len(tweet_data.get('urls', []))} URLs, {len(tweet_data.get('downloaded_media', []))} media items")
+    async def _bounded_cache(tweet_id: str) -> None:
+        async with semaphore:
+            await _cache_one(tweet_id)
 
-        except Exception as e:
-            logging.error(f"Failed to cache tweet {tweet_id}: {e}")
-            continue
+    # Batch state persistence: each tweet mutates the in-memory cache as it
+    # finishes, and the state files are flushed once after the gather instead
+    # of being rewritten per tweet
+    state_manager.begin_batch()
+    try:
+        results = await asyncio.gather(*(_bounded_cache(tid) for tid in tweet_ids), return_exceptions=True)
+    finally:
+        await state_manager.commit_batch()
+    failures = 0
+    for tweet_id, result in zip(tweet_ids, results):
+        if isinstance(result, Exception):
+            failures += 1
+            logging.error(f"Failed to cache tweet {tweet_id}: {result}")
+    logging.info("Tweet caching pass finished: %d tweets, %d failures", len(tweet_ids), failures)
 
 class TweetCacheValidator:
     """Validates the integrity of the tweet cache and fixes inconsistencies.